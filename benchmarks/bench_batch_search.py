@@ -0,0 +1,78 @@
+"""Benchmark: per-query cost of batch search at batch sizes 1, 8, 64, 512 — Both.
+
+Qdrant serves each batch with one ``query_batch_points`` request; S3 Vectors
+with a bounded parallel burst of ``query_vectors``. Query vectors are the
+SEARCH_QUERIES and movie embeddings plus small noise, so every query in a
+batch is distinct and lands near real data.
+"""
+
+import time
+
+import numpy as np
+
+from core.batch_search import qdrant_batch_search, s3v_batch_search
+from core.clients import get_clients
+from core.dataset import MOVIES, SEARCH_QUERIES
+from core.embeddings import generate_movie_embeddings, generate_query_embeddings
+
+BATCH_SIZES = [1, 8, 64, 512]
+TOP_K = 10
+REPEATS = 3  # batches per size; the median wall time is reported
+NOISE = 0.05
+
+
+def query_vectors(n: int) -> list[list[float]]:
+    seeds = np.vstack(
+        [
+            generate_query_embeddings([q["text"] for q in SEARCH_QUERIES]),
+            generate_movie_embeddings(MOVIES).matrix,
+        ]
+    )
+    rng = np.random.default_rng(0)
+    vecs = seeds[np.arange(n) % len(seeds)] + NOISE * rng.standard_normal(
+        (n, seeds.shape[1])
+    )
+    return (vecs / np.linalg.norm(vecs, axis=1, keepdims=True)).tolist()
+
+
+def median_batch_ms(search, client, vectors) -> float:
+    samples = []
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        results = search(client, vectors, TOP_K)
+        samples.append((time.perf_counter() - t0) * 1000)
+        assert len(results) == len(vectors)
+    return float(np.median(samples))
+
+
+def run():
+    qc, sc = get_clients()
+
+    print("=" * 60)
+    print(f"BENCH: Batch search per-query cost (top-{TOP_K}) — Both platforms")
+    print("=" * 60)
+
+    vectors = query_vectors(max(BATCH_SIZES))
+    print(
+        f"\n{'Batch':>6} {'Qdrant ms/q':>12} {'speedup':>8} "
+        f"{'S3V ms/q':>10} {'speedup':>8}"
+    )
+    print("-" * 50)
+    base = {}
+    for n in BATCH_SIZES:
+        row = []
+        for name, search, client in (
+            ("qdrant", qdrant_batch_search, qc),
+            ("s3v", s3v_batch_search, sc),
+        ):
+            per_query = median_batch_ms(search, client, vectors[:n]) / n
+            base.setdefault(name, per_query)
+            row += [per_query, base[name] / per_query]
+        print(f"{n:>6} {row[0]:>12.2f} {row[1]:>7.1f}x {row[2]:>10.2f} {row[3]:>7.1f}x")
+
+    print("\n→ Qdrant: one query_batch_points request per batch")
+    print("→ S3 Vectors: no batch API — parallel query_vectors burst per batch")
+
+
+if __name__ == "__main__":
+    run()
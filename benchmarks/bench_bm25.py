@@ -0,0 +1,79 @@
+"""Benchmark: local BM25 index — build time, size and query latency at scale.
+
+Indexes the synthetic corpus at each size and times keyword queries. The
+synthetic descriptions come from a few hundred template words, so every
+term is far more common than in real text — a worst case for the pruned
+search in ``core.bm25``. Latency should stay well under an S3 Vectors
+round trip, since hybrid search runs BM25 while that request is in flight.
+"""
+
+import os
+import shutil
+import time
+
+import numpy as np
+
+from core.bm25 import BM25Index
+from core.config import CACHE_DIR
+from core.dataset import SEARCH_QUERIES
+from core.hybrid import movie_document
+from core.metrics import latency_percentiles
+from core.synthetic import generate_movies
+
+SIZES = [10_000, 100_000, 1_000_000]
+TOP_K = 10
+REPEATS = 10
+RANDOM_QUERIES = 50  # 1-5 terms drawn from the vocabulary
+PATH = os.path.join(CACHE_DIR, "bench-bm25")  # scratch index, removed at the end
+
+
+def queries(index: BM25Index) -> list[str]:
+    rng = np.random.default_rng(0)
+    terms = np.asarray(index.terms)
+    drawn = [
+        " ".join(rng.choice(terms, rng.integers(1, 6)).tolist())
+        for _ in range(RANDOM_QUERIES)
+    ]
+    return [q["text"] for q in SEARCH_QUERIES] + drawn
+
+
+def run():
+    print("=" * 60)
+    print(f"BENCH: BM25 keyword search (top-{TOP_K}) — local index for S3 Vectors")
+    print("=" * 60)
+
+    print(
+        f"\n{'Docs':>10} {'Build':>7} {'Size':>8} {'Terms':>6} "
+        f"{'p50':>8} {'p99':>8} {'max':>8}"
+    )
+    print("-" * 62)
+    for n in SIZES:
+        movies = list(generate_movies(n))
+        t0 = time.perf_counter()
+        index = BM25Index.build(
+            [m["id"] for m in movies], [movie_document(m) for m in movies]
+        )
+        build_s = time.perf_counter() - t0
+        index.save(PATH)
+        index = BM25Index.load(PATH)  # memory-mapped, as in hybrid search
+
+        samples = []
+        for q in queries(index):
+            index.search(q, TOP_K)  # page in the postings once
+            for _ in range(REPEATS):
+                t0 = time.perf_counter()
+                index.search(q, TOP_K)
+                samples.append((time.perf_counter() - t0) * 1000)
+        lat = latency_percentiles(samples)
+        print(
+            f"{n:>10,} {build_s:>6.1f}s {index.nbytes / 1e6:>6.0f}MB "
+            f"{len(index.terms):>6} {lat['p50']:>6.2f}ms {lat['p99']:>6.2f}ms "
+            f"{max(samples):>6.2f}ms"
+        )
+
+    shutil.rmtree(PATH, ignore_errors=True)
+    print("\n→ Hybrid search overlaps this with the S3 query_vectors round trip")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,37 @@
+"""Benchmark: embedding backends (torch vs ONNX vs int8 ONNX) — parity & throughput."""
+
+from core.dataset import MOVIES, SEARCH_QUERIES
+from core.embeddings import BACKENDS, compare_backends, movie_text
+
+REPEAT = 20  # 55 distinct texts x 20 = 1,100 sentences per backend
+MIN_COSINE = 0.99
+
+
+def run():
+    print("=" * 60)
+    print("BENCH: Embedding backends — parity vs torch & sentences/sec")
+    print("=" * 60)
+
+    texts = [movie_text(m) for m in MOVIES] + [q["text"] for q in SEARCH_QUERIES]
+    rows = compare_backends(texts * REPEAT, backends=BACKENDS)
+
+    torch_sps = rows[0]["sentences_per_sec"]
+    print(
+        f"\n{'Backend':<12} {'Sent/sec':>10} {'Speedup':>8} "
+        f"{'Min cos':>9} {'Mean cos':>9}  Parity"
+    )
+    print("-" * 60)
+    for r in rows:
+        ok = "✓" if r["min_cosine"] >= MIN_COSINE else "✗"
+        print(
+            f"{r['backend']:<12} {r['sentences_per_sec']:>10.0f} "
+            f"{r['sentences_per_sec'] / torch_sps:>7.2f}x "
+            f"{r['min_cosine']:>9.4f} {r['mean_cosine']:>9.4f}  {ok}"
+        )
+
+    print(f"\n→ Select a backend with EMBEDDING_BACKEND=torch|onnx|onnx-int8")
+    print(f"→ Parity threshold: min cosine vs torch >= {MIN_COSINE}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,116 @@
+"""Benchmark: hybrid (dense + keyword) search latency and agreement — Both.
+
+Qdrant fuses dense and IDF-weighted sparse vectors server-side; S3 Vectors
+fuses its dense results with the local BM25 index client-side, using the
+same RRF formula and limits. The keyword rankings differ, though: Qdrant
+length-normalizes against a fixed SPARSE_AVG_DOC_LEN, the local BM25
+against the corpus's real average. Agreement is rank overlap with the
+Qdrant hybrid list, so it reflects both the backend and that difference.
+Sparse document encoding throughput is measured on the synthetic corpus.
+"""
+
+import os
+import time
+
+from core.async_search import s3v_query
+from core.clients import get_clients
+from core.config import qdrant_id
+from core.dataset import MOVIES, SEARCH_QUERIES
+from core.embeddings import generate_movie_embeddings, generate_query_embeddings
+from core.hybrid import (
+    create_qdrant_hybrid_collection,
+    movie_document,
+    movie_index,
+    qdrant_hybrid_search,
+    s3v_hybrid_search,
+)
+from core.metrics import latency_percentiles, rank_overlap
+from core.sparse import SparseEncoder, Vocabulary
+from core.synthetic import generate_movies
+
+COLLECTION = "bench_hybrid"  # scratch collection — don't touch shared 'movies'
+LIMIT = 5
+PREFETCH_LIMIT = 10
+REPEATS = 5
+ENCODE_DOCS = 100_000
+
+KEY_BY_QDRANT_ID = {qdrant_id(m["id"]): m["id"] for m in MOVIES}
+
+
+def measure(search, queries) -> dict:
+    """Run every query REPEATS times; keep the first result list per query."""
+    latencies, lists = [], []
+    for text, vec in queries:
+        for r in range(REPEATS):
+            t0 = time.perf_counter()
+            keys = search(text, vec)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            if r == 0:
+                lists.append(keys)
+    return {"lists": lists, **latency_percentiles(latencies)}
+
+
+def run():
+    qc, sc = get_clients()
+
+    print("=" * 60)
+    print(f"BENCH: Hybrid search (RRF, top-{LIMIT}) — Both platforms")
+    print("=" * 60)
+
+    movies = list(generate_movies(ENCODE_DOCS))
+    texts = [movie_document(m) for m in movies]
+    # A scratch vocabulary keeps synthetic words out of the shared one.
+    scratch = Vocabulary("bench-sparse-vocab")
+    encoder = SparseEncoder(scratch)
+    encoder.encode_documents(texts[:1000])  # vocabulary warm-up
+    t0 = time.perf_counter()
+    encoder.encode_documents(texts)
+    rate = len(texts) / (time.perf_counter() - t0)
+    print(f"  Sparse encoding: {rate:,.0f} docs/sec ({len(scratch)} tokens)")
+    for path in (scratch.path, scratch.lock_path):
+        os.remove(path)
+
+    encoder = SparseEncoder()
+    create_qdrant_hybrid_collection(
+        qc, COLLECTION, MOVIES, generate_movie_embeddings(MOVIES), encoder
+    )
+    index = movie_index(MOVIES)
+    texts = [q["text"] for q in SEARCH_QUERIES]
+    queries = list(zip(texts, generate_query_embeddings(texts).tolist()))
+
+    def qdrant(text, vec):
+        res = qdrant_hybrid_search(
+            qc, COLLECTION, encoder, text, vec, LIMIT, PREFETCH_LIMIT
+        )
+        return [KEY_BY_QDRANT_ID[h.key] for h in res.hits]
+
+    def s3v_dense(text, vec):
+        return [h.key for h in s3v_query(sc, vec, LIMIT).hits]
+
+    def s3v_hybrid(text, vec):
+        hits, _ = s3v_hybrid_search(sc, index, text, vec, LIMIT, PREFETCH_LIMIT)
+        return [h.key for h in hits]
+
+    rows = [
+        ("Qdrant hybrid", measure(qdrant, queries)),
+        ("S3V dense only", measure(s3v_dense, queries)),
+        ("S3V + BM25 hybrid", measure(s3v_hybrid, queries)),
+    ]
+    reference = rows[0][1]["lists"]
+    print(f"\n{'Strategy':<20} {'p50':>8} {'p99':>8} {'RBO vs Qdrant':>14}")
+    print("-" * 54)
+    for name, m in rows:
+        rbo = sum(
+            rank_overlap(got, ref, LIMIT) for got, ref in zip(m["lists"], reference)
+        ) / len(reference)
+        print(f"{name:<20} {m['p50']:>6.1f}ms {m['p99']:>6.1f}ms {rbo:>14.3f}")
+
+    qc.delete_collection(COLLECTION)
+    print("\n→ Same RRF fusion and limits, but not the same keyword scores:")
+    print("  Qdrant sparse: IDF x BM25 tf, fixed SPARSE_AVG_DOC_LEN length norm")
+    print("  S3V local BM25: real average length — RBO reflects both differences")
+    print("→ S3V's keyword half never leaves the host")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,106 @@
+"""Benchmark: Qdrant REST vs gRPC — upsert, search and batch search.
+
+Loads synthetic movies with random unit vectors (no encoding cost) into a
+scratch collection per size, then times the same operations over both
+transports. Each 384-float vector is ~3 KB of JSON over REST and 1.5 KB of
+packed floats over gRPC, so the gap grows with batch size and top-k.
+"""
+
+import time
+
+import numpy as np
+from qdrant_client import models
+
+from core.clients import make_qdrant
+from core.config import EMBEDDING_DIM
+from core.metrics import latency_percentiles
+from core.synthetic import generate_movies
+
+COLLECTION = "bench_transport"  # scratch collection — don't touch shared 'movies'
+SIZES = [1_000, 10_000]
+TOP_KS = [10, 100]
+UPSERT_BATCH = 256
+QUERIES = 50
+BATCH_QUERIES = 64  # queries per query_batch_points call
+TRANSPORTS = {"REST": False, "gRPC": True}
+
+
+def unit_vectors(n: int, seed: int) -> np.ndarray:
+    vecs = np.random.default_rng(seed).standard_normal((n, EMBEDDING_DIM))
+    return (vecs / np.linalg.norm(vecs, axis=1, keepdims=True)).astype(np.float32)
+
+
+def make_points(n: int) -> list[models.PointStruct]:
+    vectors = unit_vectors(n, seed=n).tolist()
+    return [
+        models.PointStruct(id=i, vector=vec, payload=movie)
+        for i, (movie, vec) in enumerate(zip(generate_movies(n), vectors))
+    ]
+
+
+def bench_upsert(qc, points) -> float:
+    """Load ``points`` in UPSERT_BATCH batches; returns points/sec."""
+    qc.recreate_collection(
+        COLLECTION,
+        vectors_config=models.VectorParams(
+            size=EMBEDDING_DIM, distance=models.Distance.COSINE
+        ),
+    )
+    t0 = time.perf_counter()
+    for lo in range(0, len(points), UPSERT_BATCH):
+        qc.upsert(COLLECTION, points[lo : lo + UPSERT_BATCH], wait=True)
+    return len(points) / (time.perf_counter() - t0)
+
+
+def bench_search(qc, queries: list[list[float]], k: int) -> dict:
+    samples = []
+    for vec in queries:
+        t0 = time.perf_counter()
+        qc.query_points(COLLECTION, query=vec, limit=k, with_payload=True)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return latency_percentiles(samples)
+
+
+def bench_batch_search(qc, queries: list[list[float]], k: int) -> float:
+    """One query_batch_points call for the whole batch; returns queries/sec."""
+    requests = [
+        models.QueryRequest(query=vec, limit=k, with_payload=True) for vec in queries
+    ]
+    t0 = time.perf_counter()
+    qc.query_batch_points(COLLECTION, requests=requests)
+    return len(queries) / (time.perf_counter() - t0)
+
+
+def run():
+    print("=" * 60)
+    print("BENCH: Qdrant transport — REST (6333) vs gRPC (6334)")
+    print("=" * 60)
+
+    clients = {name: make_qdrant(prefer_grpc=grpc) for name, grpc in TRANSPORTS.items()}
+    queries = unit_vectors(max(QUERIES, BATCH_QUERIES), seed=0).tolist()
+
+    for n in SIZES:
+        points = make_points(n)
+        print(f"\n{n:,} vectors")
+        print(
+            f"{'Transport':<10} {'Upsert/s':>9} {'top-k':>6} {'p50':>8} "
+            f"{'p99':>8} {'Batch q/s':>10}"
+        )
+        print("-" * 56)
+        for name, qc in clients.items():
+            upsert_rate = bench_upsert(qc, points)
+            for i, k in enumerate(TOP_KS):
+                lat = bench_search(qc, queries[:QUERIES], k)
+                batch_rate = bench_batch_search(qc, queries[:BATCH_QUERIES], k)
+                print(
+                    f"{name if i == 0 else '':<10} "
+                    f"{f'{upsert_rate:.0f}' if i == 0 else '':>9} {k:>6} "
+                    f"{lat['p50']:>6.1f}ms {lat['p99']:>6.1f}ms {batch_rate:>10.0f}"
+                )
+
+    clients["REST"].delete_collection(COLLECTION)
+    print("\n→ Select the transport with QDRANT_PREFER_GRPC=1 (default 0 = REST)")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,125 @@
+"""Benchmark: recall@k, nDCG & rank overlap vs exact ground truth — Both platforms.
+
+Runs SEARCH_QUERIES against both backends, unfiltered and with every
+FILTER_TESTS filter, and scores each result list against an exact local
+search over the same cached embeddings that setup.py loaded.
+"""
+
+import time
+
+from core.clients import get_clients
+from core.config import QDRANT_COLLECTION, S3V_BUCKET_NAME, S3V_INDEX_NAME, qdrant_id
+from core.dataset import FILTER_TESTS, MOVIES, SEARCH_QUERIES
+from core.embeddings import generate_movie_embeddings, generate_query_embeddings
+from core.filters import Expr, to_qdrant, to_s3v
+from core.ground_truth import ExactIndex
+from core.metadata import MetadataTable
+from core.metrics import latency_percentiles, ndcg_at_k, rank_overlap, recall_at_k
+
+TOP_K = 10
+REPEATS = 5  # timed runs per query → latency samples
+
+CASES = [{"id": "f0", "name": "No filter", "filter": None}]
+CASES += FILTER_TESTS
+
+KEY_BY_QDRANT_ID = {qdrant_id(m["id"]): m["id"] for m in MOVIES}
+
+
+def search_qdrant(qc, vec: list[float], flt: Expr | None) -> list[str]:
+    res = qc.query_points(
+        QDRANT_COLLECTION,
+        query=vec,
+        limit=TOP_K,
+        query_filter=to_qdrant(flt) if flt else None,
+        with_payload=False,
+    )
+    return [KEY_BY_QDRANT_ID[p.id] for p in res.points]
+
+
+def search_s3v(sc, vec: list[float], flt: Expr | None) -> list[str]:
+    kwargs = {"filter": to_s3v(flt)} if flt else {}
+    res = sc.query_vectors(
+        vectorBucketName=S3V_BUCKET_NAME,
+        indexName=S3V_INDEX_NAME,
+        queryVector={"float32": vec},
+        topK=TOP_K,
+        **kwargs,
+    )
+    return [v["key"] for v in res["vectors"]]
+
+
+def measure(search, client, vectors, flt, truth) -> dict:
+    """Run every query REPEATS times; score the first result list per query."""
+    latencies, recall, ndcg, overlap = [], [], [], []
+    for vec, expected in zip(vectors, truth):
+        for r in range(REPEATS):
+            t0 = time.perf_counter()
+            hits = search(client, vec, flt)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            if r == 0:
+                recall.append(recall_at_k(hits, expected, TOP_K))
+                ndcg.append(ndcg_at_k(hits, expected, TOP_K))
+                overlap.append(rank_overlap(hits, expected, TOP_K))
+    n = len(vectors)
+    return {
+        "recall": sum(recall) / n,
+        "ndcg": sum(ndcg) / n,
+        "overlap": sum(overlap) / n,
+        **latency_percentiles(latencies),
+    }
+
+
+def run():
+    qc, sc = get_clients()
+
+    print("=" * 60)
+    print(f"BENCH: Recall@{TOP_K} vs exact ground truth — Both platforms")
+    print("=" * 60)
+
+    index = ExactIndex.from_embeddings(generate_movie_embeddings(MOVIES))
+    table = MetadataTable.from_records(MOVIES)
+    aligned = table.positions(index.ids)  # table row for each index position
+    query_matrix = generate_query_embeddings([q["text"] for q in SEARCH_QUERIES])
+    vectors = [v.tolist() for v in query_matrix]
+    print(
+        f"  {len(vectors)} queries x {len(CASES)} filter cases x {REPEATS} repeats "
+        f"over {len(index)} vectors"
+    )
+
+    print(
+        f"\n{'Case':<40} {'Backend':<11} {'Recall':>6} {'nDCG':>6} "
+        f"{'RBO':>6} {'p50':>7} {'p99':>7}"
+    )
+    print("-" * 90)
+    totals = {"Qdrant": [], "S3 Vectors": []}
+    for case in CASES:
+        flt = case["filter"]
+        mask = table.mask(flt)[aligned] if flt else None
+        truth = [
+            [i for i, _ in hits] for hits in index.search_ids(query_matrix, TOP_K, mask)
+        ]
+
+        rows = [
+            ("Qdrant", measure(search_qdrant, qc, vectors, flt, truth)),
+            ("S3 Vectors", measure(search_s3v, sc, vectors, flt, truth)),
+        ]
+        for backend, m in rows:
+            totals[backend].append(m)
+            print(
+                f"{case['name'][:40]:<40} {backend:<11} {m['recall']:>6.3f} "
+                f"{m['ndcg']:>6.3f} {m['overlap']:>6.3f} "
+                f"{m['p50']:>5.0f}ms {m['p99']:>5.0f}ms"
+            )
+
+    print("\nSummary (mean over cases):")
+    for backend, ms in totals.items():
+        recall = sum(m["recall"] for m in ms) / len(ms)
+        p50 = sum(m["p50"] for m in ms) / len(ms)
+        p99 = sum(m["p99"] for m in ms) / len(ms)
+        print(
+            f"  {backend:<11} recall@{TOP_K}={recall:.3f}  p50={p50:.0f}ms  p99={p99:.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,105 @@
+"""Benchmark: top-200 on S3 Vectors via partitioned fan-out vs Qdrant limit=200.
+
+S3 Vectors caps ``topK`` at 100. ``core.s3v_topk`` gets past that by
+querying disjoint metadata partitions in parallel and heap-merging the
+results. Every strategy is scored against an exact local search; the cost
+column counts billed ``query_vectors`` calls per query.
+"""
+
+import time
+
+from core.clients import get_clients
+from core.config import QDRANT_COLLECTION, S3V_MAX_TOP_K, qdrant_id
+from core.dataset import MOVIES, SEARCH_QUERIES
+from core.embeddings import generate_movie_embeddings, generate_query_embeddings
+from core.ground_truth import ExactIndex
+from core.metadata import MetadataTable
+from core.metrics import latency_percentiles, recall_at_k
+from core.s3v_topk import categorical_partitions, range_partitions, s3v_query_top_k
+
+TOP_K = 200
+REPEATS = 3  # timed runs per query → latency samples
+DECADES = [1970, 1980, 1990, 2000, 2010, 2020]
+
+KEY_BY_QDRANT_ID = {qdrant_id(m["id"]): m["id"] for m in MOVIES}
+
+
+def search_qdrant(qc, vec: list[float]) -> tuple[list[str], dict]:
+    res = qc.query_points(QDRANT_COLLECTION, query=vec, limit=TOP_K, with_payload=False)
+    return [KEY_BY_QDRANT_ID[p.id] for p in res.points], {"requests": 1, "saturated": 0}
+
+
+def fan_out(partitions):
+    """An S3 Vectors search over ``partitions``; [None] = one unfiltered call."""
+
+    def search(sc, vec: list[float]) -> tuple[list[str], dict]:
+        hits, stats = s3v_query_top_k(sc, vec, TOP_K, partitions)
+        return [h.key for h in hits], stats
+
+    return search
+
+
+def measure(search, client, vectors, truth) -> dict:
+    """Run every query REPEATS times; score the first result list per query."""
+    latencies, recall, requests, saturated = [], [], 0, 0
+    for vec, expected in zip(vectors, truth):
+        for r in range(REPEATS):
+            t0 = time.perf_counter()
+            keys, stats = search(client, vec)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            if r == 0:
+                recall.append(recall_at_k(keys, expected, TOP_K))
+                requests += stats["requests"]
+                saturated += stats["saturated"]
+    n = len(vectors)
+    return {
+        "recall": sum(recall) / n,
+        "requests": requests / n,
+        "saturated": saturated / n,
+        **latency_percentiles(latencies),
+    }
+
+
+def run():
+    qc, sc = get_clients()
+
+    print("=" * 60)
+    print(f"BENCH: S3 Vectors top-{TOP_K} via partitioned fan-out vs Qdrant")
+    print("=" * 60)
+
+    index = ExactIndex.from_embeddings(generate_movie_embeddings(MOVIES))
+    table = MetadataTable.from_records(MOVIES)
+    query_matrix = generate_query_embeddings([q["text"] for q in SEARCH_QUERIES])
+    vectors = [v.tolist() for v in query_matrix]
+    truth = [[i for i, _ in hits] for hits in index.search_ids(query_matrix, TOP_K)]
+    print(f"  {len(vectors)} queries x {REPEATS} repeats over {len(index)} vectors")
+
+    capped = fan_out([None])  # one plain call: today's best without fan-out
+    strategies = [
+        ("Qdrant limit=200", search_qdrant, qc),
+        (f"S3V topK={S3V_MAX_TOP_K} (capped)", capped, sc),
+        ("S3V by genre", fan_out(categorical_partitions(table, "genre")), sc),
+        ("S3V by decade", fan_out(range_partitions("year", DECADES)), sc),
+    ]
+
+    print(
+        f"\n{'Strategy':<24} {'Recall':>6} {'p50':>7} {'p99':>7} "
+        f"{'Calls/q':>8} {'Saturated':>9}"
+    )
+    print("-" * 66)
+    for name, search, client in strategies:
+        m = measure(search, client, vectors, truth)
+        print(
+            f"{name:<24} {m['recall']:>6.3f} {m['p50']:>5.0f}ms {m['p99']:>5.0f}ms "
+            f"{m['requests']:>8.1f} {m['saturated']:>9.1f}"
+        )
+
+    print("\n→ Recall lost vs Qdrant = Qdrant recall − S3V recall (same exact truth)")
+    print("→ S3V bills per query_vectors call: cost/query scales with Calls/q")
+    print(
+        f"→ Saturated partitions returned {S3V_MAX_TOP_K} hits and may hide true top-k"
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,129 @@
+"""Concurrent query fan-out to Qdrant and S3 Vectors on one asyncio loop.
+
+Qdrant is queried through ``AsyncQdrantClient``. boto3 has no asyncio API,
+so S3 Vectors calls run on a bounded thread pool (boto3 clients are
+thread-safe). Each backend has its own semaphore, so N queries take about
+max(latency) x N / concurrency instead of sum(latency) x N, and every call
+records its own latency.
+
+    with DualSearch() as search:
+        results = search.run(search.compare(vectors, top_k=5))
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from core.clients import get_s3v, make_async_qdrant
+from core.config import (
+    QDRANT_COLLECTION,
+    QUERY_CONCURRENCY,
+    S3V_BUCKET_NAME,
+    S3V_INDEX_NAME,
+)
+from core.filters import Expr, to_qdrant, to_s3v
+
+
+@dataclass
+class Hit:
+    """One result. ``score`` is the backend's own value: cosine similarity
+    for Qdrant, cosine distance for S3 Vectors."""
+
+    key: str | int
+    score: float
+    payload: dict
+
+
+@dataclass
+class Result:
+    hits: list[Hit]
+    ms: float
+
+
+def s3v_query(sc, vec: list[float], top_k: int, flt: Expr | None = None) -> Result:
+    """One blocking ``query_vectors`` call, timed."""
+    t0 = time.perf_counter()
+    res = sc.query_vectors(
+        vectorBucketName=S3V_BUCKET_NAME,
+        indexName=S3V_INDEX_NAME,
+        queryVector={"float32": vec},
+        topK=top_k,
+        returnDistance=True,
+        returnMetadata=True,
+        **({"filter": to_s3v(flt)} if flt else {}),
+    )
+    ms = (time.perf_counter() - t0) * 1000
+    hits = [Hit(v["key"], v["distance"], v["metadata"]) for v in res["vectors"]]
+    return Result(hits, ms)
+
+
+class DualSearch:
+    """Owns an event loop, an async Qdrant client and the S3 thread pool."""
+
+    def __init__(self, concurrency: int = QUERY_CONCURRENCY):
+        self.concurrency = concurrency
+        self.loop = asyncio.new_event_loop()
+        # Built inside the loop: the gRPC channel binds to the running loop.
+        self.qdrant = self.run(self._connect())
+        self.s3v = get_s3v()
+        self._pool = ThreadPoolExecutor(concurrency, thread_name_prefix="s3v-query")
+        self._qdrant_slots = asyncio.Semaphore(concurrency)
+        self._s3v_slots = asyncio.Semaphore(concurrency)
+
+    async def _connect(self):
+        return make_async_qdrant()
+
+    def __enter__(self) -> "DualSearch":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.loop.run_until_complete(self.qdrant.close())
+        self.loop.close()
+        self._pool.shutdown()
+
+    def run(self, coro):
+        """Run a coroutine of this object to completion."""
+        return self.loop.run_until_complete(coro)
+
+    async def qdrant_search(
+        self, vec: list[float], top_k: int, flt: Expr | None = None
+    ) -> Result:
+        async with self._qdrant_slots:
+            t0 = time.perf_counter()
+            res = await self.qdrant.query_points(
+                QDRANT_COLLECTION,
+                query=vec,
+                limit=top_k,
+                query_filter=to_qdrant(flt) if flt else None,
+                with_payload=True,
+            )
+            ms = (time.perf_counter() - t0) * 1000
+        return Result([Hit(p.id, p.score, p.payload) for p in res.points], ms)
+
+    async def s3v_search(
+        self, vec: list[float], top_k: int, flt: Expr | None = None
+    ) -> Result:
+        async with self._s3v_slots:
+            return await self.loop.run_in_executor(
+                self._pool, s3v_query, self.s3v, vec, top_k, flt
+            )
+
+    async def search_both(
+        self, vec: list[float], top_k: int, flt: Expr | None = None
+    ) -> tuple[Result, Result]:
+        """(Qdrant result, S3 Vectors result) for one query, issued together."""
+        return await asyncio.gather(
+            self.qdrant_search(vec, top_k, flt), self.s3v_search(vec, top_k, flt)
+        )
+
+    async def compare(
+        self, vectors: list[list[float]], top_k: int, flt: Expr | None = None
+    ) -> list[tuple[Result, Result]]:
+        """:meth:`search_both` for every vector, all in flight at once."""
+        return await asyncio.gather(
+            *(self.search_both(vec, top_k, flt) for vec in vectors)
+        )
@@ -0,0 +1,99 @@
+"""Batch search: many query vectors per round trip, results aligned to inputs.
+
+Qdrant takes the whole batch in one ``query_batch_points`` request. S3
+Vectors has no batch query API, so the batch becomes a bounded parallel
+burst of ``query_vectors`` calls, each retried with full-jitter backoff when
+throttled (as in ``s3v_loader``). ``filters`` is one expression for every
+query or a list aligned with ``vectors`` (None = unfiltered).
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+from core.async_search import Hit, Result, s3v_query
+from core.config import QDRANT_COLLECTION, QUERY_CONCURRENCY
+from core.filters import Expr, to_qdrant
+from core.s3v_loader import BACKOFF_BASE_S, BACKOFF_CAP_S, MAX_ATTEMPTS, _is_throttle
+
+
+def _aligned(filters: Expr | list[Expr | None] | None, n: int) -> list:
+    if isinstance(filters, list):
+        if len(filters) != n:
+            raise ValueError(f"{len(filters)} filters for {n} query vectors")
+        return filters
+    return [filters] * n
+
+
+def qdrant_batch_search(
+    qc,
+    vectors: list[list[float]],
+    top_k: int,
+    filters: Expr | list[Expr | None] | None = None,
+) -> list[Result]:
+    """One ``query_batch_points`` call; every Result carries that call's latency."""
+    from qdrant_client import models
+
+    requests = [
+        models.QueryRequest(
+            query=vec,
+            limit=top_k,
+            filter=to_qdrant(flt) if flt else None,
+            with_payload=True,
+        )
+        for vec, flt in zip(vectors, _aligned(filters, len(vectors)))
+    ]
+    t0 = time.perf_counter()
+    responses = qc.query_batch_points(QDRANT_COLLECTION, requests=requests)
+    ms = (time.perf_counter() - t0) * 1000
+    return [
+        Result([Hit(p.id, p.score, p.payload) for p in res.points], ms)
+        for res in responses
+    ]
+
+
+def _s3v_query_retrying(sc, vec, top_k, flt) -> Result:
+    """``s3v_query``, retried with full-jitter backoff when throttled."""
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return s3v_query(sc, vec, top_k, flt)
+        except Exception as exc:
+            if not _is_throttle(exc) or attempt == MAX_ATTEMPTS - 1:
+                raise
+            time.sleep(
+                random.uniform(0, min(BACKOFF_CAP_S, BACKOFF_BASE_S * 2**attempt))
+            )
+
+
+def s3v_batch_search(
+    sc,
+    vectors: list[list[float]],
+    top_k: int,
+    filters: Expr | list[Expr | None] | None = None,
+    concurrency: int = QUERY_CONCURRENCY,
+) -> list[Result]:
+    """``query_vectors`` per vector, at most ``concurrency`` in flight.
+
+    A throttled call backs off and retries on its own thread, so one
+    ThrottlingException does not abort the batch.
+    """
+    flts = _aligned(filters, len(vectors))
+    with ThreadPoolExecutor(min(concurrency, max(len(vectors), 1))) as pool:
+        return list(
+            pool.map(_s3v_query_retrying, repeat(sc), vectors, repeat(top_k), flts)
+        )
+
+
+def batch_search(
+    qc,
+    sc,
+    vectors: list[list[float]],
+    top_k: int,
+    filters: Expr | list[Expr | None] | None = None,
+) -> tuple[list[Result], list[Result]]:
+    """(Qdrant results, S3 Vectors results), each aligned with ``vectors``."""
+    return (
+        qdrant_batch_search(qc, vectors, top_k, filters),
+        s3v_batch_search(sc, vectors, top_k, filters),
+    )
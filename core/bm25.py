@@ -0,0 +1,219 @@
+"""Local BM25 inverted index: the keyword half of hybrid search on S3 Vectors.
+
+Postings are stored term-major in CSR form, one memory-mapped ``.npy`` per
+array in ``CACHE_DIR/<name>/``:
+
+    terms.npy     sorted vocabulary; a term's id is its position
+    offsets.npy   int64, postings of term t are [offsets[t], offsets[t + 1])
+    docs.npy      int32 document row of each posting, ascending per term
+    impacts.npy   float32 BM25 weight of the term in that document
+    order.npy     int32 per-term permutation visiting postings by impact, desc
+    keys.npy      document keys, row-aligned
+    meta.json     k1, b and a fingerprint of the indexed corpus
+
+BM25 weights are precomputed at build time. A query reads each term's
+postings in impact order to a growing depth, scores the documents seen so
+far exactly (binary search in the doc-ordered postings), and stops once the
+k-th score beats the best any unseen document could still reach — so a
+query touches a few thousand postings, not every posting of every term.
+Queries that never converge fall back to one ``bincount`` over all rows.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from collections.abc import Iterable
+
+import numpy as np
+
+from core.config import BM25_B, BM25_K1, CACHE_DIR
+
+TOKEN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has he her his in is it its of on or "
+    "she that the their them they this to was were who whose will with".split()
+)
+ARRAYS = ("terms", "offsets", "docs", "impacts", "order", "keys")
+MIN_DEPTH = 64  # postings read per term in the first pruned round
+PRUNE_COST = 16  # relative cost of a binary-search probe vs a scanned posting
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased alphanumeric tokens, stopwords removed."""
+    return [t for t in TOKEN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def fingerprint(keys: list[str], texts: list[str]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for key, text in zip(keys, texts):
+        h.update(f"\x00{key}\x00{text}".encode())
+    return h.hexdigest()
+
+
+class BM25Index:
+    """Immutable BM25 index over ``keys``; see the module docstring for layout."""
+
+    def __init__(self, terms, offsets, docs, impacts, order, keys, meta: dict):
+        self.terms = terms
+        self.offsets = offsets
+        self.docs = docs
+        self.impacts = impacts
+        self.order = order
+        self.keys = keys
+        self.meta = meta
+
+    @classmethod
+    def build(
+        cls, keys: list[str], texts: list[str], k1: float = BM25_K1, b: float = BM25_B
+    ) -> "BM25Index":
+        n = len(keys)
+        vocab: dict[str, int] = {}
+        doc_tokens = [
+            [vocab.setdefault(t, len(vocab)) for t in tokenize(s)] for s in texts
+        ]
+        doc_len = np.fromiter(map(len, doc_tokens), dtype=np.int64, count=n)
+        token_ids = np.fromiter(
+            (i for toks in doc_tokens for i in toks),
+            dtype=np.int64,
+            count=doc_len.sum(),
+        )
+
+        # Renumber terms in sorted order so term ids are stable for a corpus.
+        terms = np.array(sorted(vocab), dtype=str)
+        rank = np.empty(len(vocab), dtype=np.int64)
+        rank[[vocab[t] for t in terms.tolist()]] = np.arange(len(vocab))
+        doc_of = np.repeat(np.arange(n, dtype=np.int64), doc_len)
+        pairs, tf = np.unique(rank[token_ids] * n + doc_of, return_counts=True)
+        term_of, docs = np.divmod(pairs, n)
+
+        df = np.bincount(term_of, minlength=len(terms))
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(df, out=offsets[1:])
+        idf = np.log1p((n - df + 0.5) / (df + 0.5))
+        norm = k1 * (1 - b + b * doc_len[docs] / max(doc_len.mean(), 1e-9))
+        impacts = (idf[term_of] * tf * (k1 + 1) / (tf + norm)).astype(np.float32)
+        by_impact = np.lexsort((docs, -impacts, term_of))
+        order = (by_impact - offsets[term_of]).astype(np.int32)
+
+        meta = {"k1": k1, "b": b, "fingerprint": fingerprint(keys, texts)}
+        return cls(
+            terms,
+            offsets,
+            docs.astype(np.int32),
+            impacts,
+            order,
+            np.array(keys, dtype=str),
+            meta,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        arrays = [
+            np.load(os.path.join(path, f"{a}.npy"), mmap_mode="r") for a in ARRAYS
+        ]
+        return cls(*arrays, meta)
+
+    def save(self, path: str) -> None:
+        """Write to ``path`` via a sibling temp directory, replacing it whole."""
+        tmp = f"{path}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        for a in ARRAYS:
+            np.save(os.path.join(tmp, f"{a}.npy"), getattr(self, a))
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump(self.meta, f)
+        shutil.rmtree(path, ignore_errors=True)
+        os.rename(tmp, path)
+
+    @classmethod
+    def open(cls, name: str, keys: list[str], texts: list[str]) -> "BM25Index":
+        """Load ``CACHE_DIR/<name>`` if it indexes exactly this corpus, else rebuild."""
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            index = cls.load(path)
+            meta = {"k1": BM25_K1, "b": BM25_B, "fingerprint": fingerprint(keys, texts)}
+            if index.meta == meta:
+                return index
+        except (OSError, ValueError):
+            pass
+        index = cls.build(keys, texts)
+        index.save(path)
+        return cls.load(path)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def term_ids(self, tokens: Iterable[str]) -> np.ndarray:
+        """Ids of the distinct ``tokens`` present in the vocabulary."""
+        tokens = sorted(set(tokens))
+        if not tokens or not len(self.terms):
+            return np.zeros(0, dtype=np.int64)
+        pos = np.searchsorted(self.terms, tokens)
+        pos = np.minimum(pos, len(self.terms) - 1)
+        return pos[self.terms[pos] == np.array(tokens)]
+
+    def search(self, query: str, k: int = 10) -> list[tuple[str, float]]:
+        """Top ``k`` (key, BM25 score) for ``query``, best first."""
+        ids = self.term_ids(tokenize(query))
+        if not len(ids):
+            return []
+        spans = [(int(self.offsets[t]), int(self.offsets[t + 1])) for t in ids.tolist()]
+        candidates, scores, exact = self._pruned(spans, k)
+        if not exact:
+            floor = np.partition(scores, -k)[-k] if len(scores) >= k else 0.0
+            candidates, scores = self._exhaustive(spans, floor)
+        if len(scores) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[top], scores[top]
+        order = np.argsort(-scores, kind="stable")
+        return [
+            (str(self.keys[d]), float(s))
+            for d, s in zip(candidates[order].tolist(), scores[order].tolist())
+        ]
+
+    def _pruned(self, spans: list[tuple[int, int]], k: int):
+        """(candidates, scores, exact) from impact-ordered prefixes of each
+        term's postings. ``exact`` is False when the prefixes got too deep to
+        beat a full scan; the scores seen so far still bound the k-th best."""
+        total = sum(b - a for a, b in spans)
+        depth = max(MIN_DEPTH, k)
+        while True:
+            heads = [a + self.order[a : min(a + depth, b)] for a, b in spans]
+            candidates = np.unique(np.concatenate([self.docs[h] for h in heads]))
+            scores = np.zeros(len(candidates))
+            for a, b in spans:
+                postings = self.docs[a:b]
+                pos = np.searchsorted(postings, candidates).clip(max=b - a - 1)
+                hit = postings[pos] == candidates
+                scores[hit] += self.impacts[a + pos[hit]]
+            # A document outside every prefix gets at most each term's next impact.
+            bound = sum(
+                float(self.impacts[a + self.order[a + depth]])
+                for a, b in spans
+                if a + depth < b
+            )
+            if bound == 0 or (
+                len(scores) >= k and np.partition(scores, -k)[-k] >= bound
+            ):
+                return candidates, scores, True
+            depth *= 4
+            # Each round costs ~depth x terms² binary searches; a scan costs ~total.
+            if depth * len(spans) ** 2 * PRUNE_COST > total:
+                return candidates, scores, False
+
+    def _exhaustive(self, spans: list[tuple[int, int]], floor: float):
+        """Score every posting of every query term; keep scores >= ``floor``."""
+        scores = np.zeros(len(self), dtype=np.float32)
+        for a, b in spans:
+            scores[self.docs[a:b]] += self.impacts[a:b]  # one posting per document
+        # float32 sums may round just below the float64 floor.
+        candidates = np.flatnonzero(scores >= floor * (1 - 1e-6) if floor else scores)
+        return candidates, scores[candidates]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, a).nbytes for a in ARRAYS)
@@ -1,20 +1,50 @@
-"""Lightweight client factory — returns ready-to-use clients without reloading data."""
+"""Lightweight client factory — returns ready-to-use clients without reloading data.
 
-import boto3
-from qdrant_client import QdrantClient
+boto3 and qdrant_client are imported on first use, so importing this module
+(or a test that never talks to a backend) does not pay for them.
+"""
 
-from core.config import AWS_REGION, QDRANT_URL
+from typing import TYPE_CHECKING
+
+from core.config import AWS_REGION, QDRANT_GRPC_PORT, QDRANT_PREFER_GRPC, QDRANT_URL
+
+if TYPE_CHECKING:
+    from qdrant_client import AsyncQdrantClient, QdrantClient
 
 # Module-level singletons (created once, reused across tests)
 _qc = None
 _sc = None
 
 
-def get_qdrant() -> QdrantClient:
-    """Return a Qdrant client (singleton)."""
+def make_qdrant(prefer_grpc: bool = QDRANT_PREFER_GRPC) -> "QdrantClient":
+    """Build a new Qdrant client over gRPC (port 6334) or REST (port 6333)."""
+    from qdrant_client import QdrantClient
+
+    return QdrantClient(
+        url=QDRANT_URL,
+        grpc_port=QDRANT_GRPC_PORT,
+        prefer_grpc=prefer_grpc,
+        timeout=120,
+    )
+
+
+def make_async_qdrant(prefer_grpc: bool = QDRANT_PREFER_GRPC) -> "AsyncQdrantClient":
+    """Build a new asyncio Qdrant client (one per event loop)."""
+    from qdrant_client import AsyncQdrantClient
+
+    return AsyncQdrantClient(
+        url=QDRANT_URL,
+        grpc_port=QDRANT_GRPC_PORT,
+        prefer_grpc=prefer_grpc,
+        timeout=120,
+    )
+
+
+def get_qdrant() -> "QdrantClient":
+    """Return the shared Qdrant client (singleton; transport from QDRANT_PREFER_GRPC)."""
     global _qc
     if _qc is None:
-        _qc = QdrantClient(url=QDRANT_URL, timeout=120)
+        _qc = make_qdrant()
     return _qc
 
 
@@ -22,6 +52,8 @@ def get_s3v():
     """Return an S3 Vectors boto3 client (singleton)."""
     global _sc
     if _sc is None:
+        import boto3
+
         _sc = boto3.client("s3vectors", region_name=AWS_REGION)
     return _sc
 
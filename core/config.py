@@ -9,16 +9,56 @@ load_dotenv()
 # --- Qdrant ---
 QDRANT_URL = "http://localhost:6333"
 QDRANT_COLLECTION = "movies"
+QDRANT_GRPC_PORT = 6334
+# REST by default; set to 1 for gRPC (port 6334), see bench_qdrant_transport
+QDRANT_PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC", "0") == "1"
+QDRANT_UPLOAD_BATCH_SIZE = 256  # points per upload_points request
+QDRANT_UPLOAD_PARALLEL = int(os.getenv("QDRANT_UPLOAD_PARALLEL", "4"))  # upload workers
+QDRANT_PARALLEL_MIN_POINTS = 20_000  # smaller loads upload in-process (no workers)
+QDRANT_GREEN_TIMEOUT_S = 600  # max wait for indexing to finish after a bulk load
 
 # --- S3 Vectors ---
 AWS_REGION = "us-east-1"
 S3V_BUCKET_NAME = "movie-search-comparison"
 S3V_INDEX_NAME = "movies"
+# Per-index service quotas (see test_24_batch_limits)
+S3V_PUT_MAX_VECTORS = 500  # vectors per put_vectors call
+S3V_MAX_TOP_K = 100  # results per query_vectors call (see test_22_topk_limit)
+S3V_MAX_REQUEST_BYTES = 20 * 1024 * 1024  # request payload
+S3V_WRITE_RPS = 1000  # write requests per second
+S3V_WRITE_VECTORS_PER_SEC = 2500  # vectors inserted per second
+S3V_LOAD_WORKERS = int(os.getenv("S3V_LOAD_WORKERS", "8"))  # concurrent put_vectors
+S3V_LIST_MAX_RESULTS = 1000  # vectors per list_vectors page
+S3V_LIST_MAX_SEGMENTS = 16  # segmentCount limit for parallel list_vectors
+S3V_SCAN_WORKERS = int(os.getenv("S3V_SCAN_WORKERS", "8"))  # concurrent list_vectors
+
+# --- Queries ---
+QUERY_CONCURRENCY = 16  # in-flight queries per backend (core.async_search)
+S3V_GROUP_MAX_FANOUT = 32  # above this many groups, over-fetch-and-bucket instead
+BM25_K1 = 1.2  # term-frequency saturation (core.bm25)
+BM25_B = 0.75  # document-length normalization
+SPARSE_AVG_DOC_LEN = 16  # fixed BM25 length norm for sparse vectors (core.sparse)
+RRF_K = 2  # Qdrant's RRF constant: score = sum of 1 / (RRF_K + rank), rank from 0
 
 # --- Embeddings ---
 EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 EMBEDDING_DIM = 384
+EMBEDDING_BATCH_SIZE = 64
+# torch | onnx | onnx-int8 (dynamically quantized ONNX, CPU only)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+# Worker processes for bulk encoding (each holds one model copy); 1 = in-process
+EMBEDDING_WORKERS = int(os.getenv("EMBEDDING_WORKERS", "1"))
+EMBEDDING_CHUNK_SIZE = 1024  # records per worker task when streaming
+PIPELINE_QUEUE_DEPTH = 4  # encoded batches buffered per backend during ingest
 CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".cache")
+QUERY_CACHE_MAX_BYTES = 64 * 1024 * 1024  # in-process LRU budget for query vectors
+# Unix socket of the optional embedding daemon (python -m core.embed_server)
+EMBED_SOCKET = os.getenv("EMBED_SOCKET", os.path.join(CACHE_DIR, "embed.sock"))
+
+# --- Startup ---
+STARTUP_BUDGET_MS = 500  # import-time budget per entry point (run_all --import-report)
+# Per-entry-point exceptions to STARTUP_BUDGET_MS, declared by module name
+STARTUP_BUDGET_OVERRIDES_MS: dict[str, int] = {}
 
 
 def qdrant_id(string_id: str) -> int:
@@ -1,5 +1,7 @@
 """Movie dataset, search queries, and filter test cases."""
 
+from core.filters import field
+
 # 50 movies with rich metadata for comparison testing
 MOVIES = [
     {
@@ -540,63 +542,40 @@ FILTER_TESTS = [
     {
         "id": "f1",
         "name": "Exact match: genre = Sci-Fi",
-        "qdrant_filter": {"must": [{"key": "genre", "match": {"value": "Sci-Fi"}}]},
-        "s3v_filter": {"genre": "Sci-Fi"},
+        "filter": field("genre") == "Sci-Fi",
     },
     {
         "id": "f2",
         "name": "Numeric range: year >= 2010",
-        "qdrant_filter": {"must": [{"key": "year", "range": {"gte": 2010}}]},
-        "s3v_filter": {"year": {"$gte": 2010}},
+        "filter": field("year") >= 2010,
     },
     {
         "id": "f3",
         "name": "Numeric range: rating > 8.5",
-        "qdrant_filter": {"must": [{"key": "rating", "range": {"gt": 8.5}}]},
-        "s3v_filter": {"rating": {"$gt": 8.5}},
+        "filter": field("rating") > 8.5,
     },
     {
         "id": "f4",
         "name": "Combined AND: Sci-Fi + year >= 2010",
-        "qdrant_filter": {
-            "must": [
-                {"key": "genre", "match": {"value": "Sci-Fi"}},
-                {"key": "year", "range": {"gte": 2010}},
-            ]
-        },
-        "s3v_filter": {"$and": [{"genre": "Sci-Fi"}, {"year": {"$gte": 2010}}]},
+        "filter": (field("genre") == "Sci-Fi") & (field("year") >= 2010),
     },
     {
         "id": "f5",
         "name": "OR logic: Drama OR Comedy",
-        "qdrant_filter": {
-            "should": [
-                {"key": "genre", "match": {"value": "Drama"}},
-                {"key": "genre", "match": {"value": "Comedy"}},
-            ]
-        },
-        "s3v_filter": {"$or": [{"genre": "Drama"}, {"genre": "Comedy"}]},
+        "filter": (field("genre") == "Drama") | (field("genre") == "Comedy"),
     },
     {
         "id": "f6",
         "name": "Negation: language != English",
-        "qdrant_filter": {
-            "must_not": [{"key": "language", "match": {"value": "English"}}]
-        },
-        "s3v_filter": {"language": {"$ne": "English"}},
+        "filter": field("language") != "English",
     },
     {
         "id": "f7",
         "name": "Set membership: genre IN [Action, Thriller]",
-        "qdrant_filter": {
-            "should": [
-                {"key": "genre", "match": {"value": "Action"}},
-                {"key": "genre", "match": {"value": "Thriller"}},
-            ]
-        },
-        "s3v_filter": {"genre": {"$in": ["Action", "Thriller"]}},
+        "filter": field("genre").isin(["Action", "Thriller"]),
     },
 ]
+FILTERS = {t["id"]: t["filter"] for t in FILTER_TESTS}  # expression by test id
 
 
 # --- Recommendation Test (Round 2 — Qdrant only) ---
@@ -0,0 +1,200 @@
+"""Local embedding daemon — one warm model shared by every test/benchmark process.
+
+Start it once:
+
+    python -m core.embed_server
+
+While it is running, core.embeddings sends encode requests to it over a Unix
+socket instead of loading the model in-process. Concurrent requests from many
+clients are micro-batched into a single ``model.encode`` call.
+
+Wire format: every frame is a 4-byte big-endian length followed by the body.
+A request is one JSON frame; a reply is a JSON header frame, followed by one
+frame of raw float32 bytes when the header has a ``shape``.
+"""
+
+import json
+import os
+import queue
+import socket
+import socketserver
+import struct
+import threading
+import time
+
+import numpy as np
+
+from core.config import EMBED_SOCKET, EMBEDDING_BATCH_SIZE
+
+MAX_BATCH_TEXTS = 256  # flush a micro-batch once it holds this many texts
+MAX_WAIT_MS = 5  # ...or once the oldest request has waited this long
+CONNECT_TIMEOUT_S = 1.0
+RETRY_AFTER_S = 5.0  # after a failed connect, encode locally this long
+
+_retry_at = 0.0  # monotonic time of the next connect attempt
+
+
+def _send(sock: socket.socket, body: bytes) -> None:
+    sock.sendall(struct.pack("!I", len(body)) + body)
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("embedding daemon closed the connection")
+        buf += chunk
+    return bytes(buf)
+
+
+def _recv(sock: socket.socket) -> bytes:
+    (n,) = struct.unpack("!I", _recv_exact(sock, 4))
+    return _recv_exact(sock, n)
+
+
+def _request(payload: dict) -> tuple[dict, bytes]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT_S)
+        sock.connect(EMBED_SOCKET)
+        sock.settimeout(None)  # encoding a large batch may take a while
+        _send(sock, json.dumps(payload).encode())
+        header = json.loads(_recv(sock))
+        body = _recv(sock) if "shape" in header else b""
+    return header, body
+
+
+# ── Client ────────────────────────────────────────────────────
+
+
+def remote_encode(texts: list[str], model_id: str) -> np.ndarray | None:
+    """Encode ``texts`` on the daemon, or return None if it is not usable.
+
+    None means "encode locally": no socket, a stale socket, or a daemon that
+    serves a different model. Errors raised by the model itself propagate.
+    """
+    global _retry_at
+    if time.monotonic() < _retry_at or not os.path.exists(EMBED_SOCKET):
+        return None
+    try:
+        header, body = _request({"op": "encode", "model": model_id, "texts": texts})
+    except OSError:
+        _retry_at = time.monotonic() + RETRY_AFTER_S
+        return None
+    if header.get("error") == "model_mismatch":
+        _retry_at = time.monotonic() + RETRY_AFTER_S
+        return None
+    if "error" in header:
+        raise RuntimeError(f"embedding daemon: {header['error']}")
+    return np.frombuffer(body, dtype=np.float32).reshape(header["shape"])
+
+
+def daemon_stats() -> dict | None:
+    """Counters from the running daemon, or None if none is running."""
+    try:
+        header, _ = _request({"op": "stats"})
+    except OSError:
+        return None
+    return header
+
+
+# ── Server ────────────────────────────────────────────────────
+
+
+class _MicroBatcher:
+    """Collects concurrent requests and encodes them in one forward pass."""
+
+    def __init__(self, model):
+        self.model = model
+        self.queue: queue.Queue = queue.Queue()
+        self.stats = {"requests": 0, "batches": 0, "texts": 0}
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        slot = {"texts": texts, "done": threading.Event()}
+        self.queue.put(slot)
+        slot["done"].wait()
+        if "error" in slot:
+            raise slot["error"]
+        return slot["vectors"]
+
+    def run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            n = len(batch[0]["texts"])
+            deadline = time.monotonic() + MAX_WAIT_MS / 1000
+            while n < MAX_BATCH_TEXTS:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    slot = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                batch.append(slot)
+                n += len(slot["texts"])
+            self._flush(batch)
+
+    def _flush(self, batch: list[dict]) -> None:
+        texts = [t for slot in batch for t in slot["texts"]]
+        try:
+            vectors = self.model.encode(
+                texts, batch_size=EMBEDDING_BATCH_SIZE, normalize_embeddings=True
+            ).astype(np.float32)
+        except Exception as e:
+            for slot in batch:
+                slot["error"] = e
+                slot["done"].set()
+            return
+        self.stats["requests"] += len(batch)
+        self.stats["batches"] += 1
+        self.stats["texts"] += len(texts)
+        offset = 0
+        for slot in batch:
+            slot["vectors"] = vectors[offset : offset + len(slot["texts"])]
+            offset += len(slot["texts"])
+            slot["done"].set()
+
+
+def serve() -> None:
+    """Load the model once and serve encode requests until interrupted."""
+    from core.embeddings import _model_id, get_model
+
+    model_id = _model_id()
+    batcher = _MicroBatcher(get_model())
+    threading.Thread(target=batcher.run, daemon=True).start()
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            request = json.loads(_recv(self.request))
+            if request.get("op") == "stats":
+                _send(self.request, json.dumps({**batcher.stats}).encode())
+                return
+            if request.get("model") != model_id:
+                _send(self.request, json.dumps({"error": "model_mismatch"}).encode())
+                return
+            try:
+                vectors = batcher.encode(request["texts"])
+            except Exception as e:
+                _send(self.request, json.dumps({"error": str(e)}).encode())
+                return
+            _send(self.request, json.dumps({"shape": vectors.shape}).encode())
+            _send(self.request, vectors.tobytes())
+
+    os.makedirs(os.path.dirname(EMBED_SOCKET), exist_ok=True)
+    if os.path.exists(EMBED_SOCKET):
+        os.remove(EMBED_SOCKET)  # stale socket from a previous run
+    server = socketserver.ThreadingUnixStreamServer(EMBED_SOCKET, Handler)
+    server.daemon_threads = True
+    print(f"  Embedding daemon ({model_id}) listening on {EMBED_SOCKET}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(EMBED_SOCKET)
+        print(f"  Embedding daemon stopped: {batcher.stats}")
+
+
+if __name__ == "__main__":
+    serve()
@@ -1,53 +1,426 @@
 """Embedding generation and caching using sentence-transformers."""
 
-import json
+import hashlib
+import itertools
+import multiprocessing
 import os
+import platform
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
 
-from core.config import CACHE_DIR, EMBEDDING_MODEL
+from core.config import (
+    CACHE_DIR,
+    EMBEDDING_BACKEND,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_CHUNK_SIZE,
+    EMBEDDING_DIM,
+    EMBEDDING_MODEL,
+    EMBEDDING_WORKERS,
+    QUERY_CACHE_MAX_BYTES,
+)
+from core.embed_server import remote_encode
+from core.vector_store import VectorStore
 
-_model = None
+if TYPE_CHECKING:  # sentence_transformers pulls in torch; import it on first use
+    from sentence_transformers import SentenceTransformer
 
+BACKENDS = ("torch", "onnx", "onnx-int8")
 
-def get_model() -> SentenceTransformer:
-    global _model
-    if _model is None:
-        print(f"  Loading model: {EMBEDDING_MODEL}...")
-        _model = SentenceTransformer(EMBEDDING_MODEL)
-    return _model
+_models: dict[str, "SentenceTransformer"] = {}
+_store = None
+_query_cache = None
 
 
-def _cache_path(name: str) -> str:
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    return os.path.join(CACHE_DIR, f"{name}.json")
+class EmbeddingMatrix(Mapping):
+    """Read-only {key: vector} mapping over a contiguous float32 matrix.
 
+    ``ids[i]`` is stored at ``matrix[rows[i]]``. Lookups return row views into
+    ``matrix`` (memory-mapped when loaded from the cache), so nothing is copied
+    until a caller asks for ``.tolist()``; the id → position dict is only built
+    on the first lookup by key.
+    """
 
-def generate_movie_embeddings(movies: list[dict]) -> dict[str, list[float]]:
-    """Generate embeddings for movies. Returns {movie_id: embedding_list}."""
-    path = _cache_path("movie_embeddings")
-    if os.path.exists(path):
-        print("  Using cached movie embeddings.")
-        with open(path) as f:
-            return json.load(f)
+    def __init__(self, matrix: np.ndarray, ids: list[str], rows: np.ndarray):
+        self.matrix = matrix
+        self.ids = ids
+        self.rows = rows
+        self._position: dict[str, int] | None = None
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if self._position is None:
+            self._position = {k: i for i, k in enumerate(self.ids)}
+        return self.matrix[self.rows[self._position[key]]]
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class QueryCache:
+    """Two-tier query embedding cache: in-process LRU over a persistent store.
+
+    The LRU is bounded by ``max_bytes`` of vector data; evicted entries stay on
+    disk, so later processes (and later runs) still skip the encode.
+    """
+
+    def __init__(self, store: VectorStore, max_bytes: int):
+        self.store = store
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._lru: OrderedDict[str, np.ndarray] = OrderedDict()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    def get(self, key: str) -> np.ndarray | None:
+        vec = self._lru.get(key)
+        if vec is not None:
+            self._lru.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return vec
+        vec = self.store.get(key)
+        if vec is not None:
+            self.stats["disk_hits"] += 1
+            vec = np.array(vec)
+            self._remember(key, vec)
+            return vec
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key: str, vec: np.ndarray) -> None:
+        self.put_many([key], vec[None])
+
+    def put_many(self, keys: list[str], vectors: np.ndarray) -> None:
+        self.store.append(keys, vectors)
+        for key, vec in zip(keys, vectors):
+            self._remember(key, vec)
+
+    def _remember(self, key: str, vec: np.ndarray) -> None:
+        if key in self._lru:
+            return
+        self._lru[key] = vec
+        self.nbytes += vec.nbytes
+        while self.nbytes > self.max_bytes and self._lru:
+            _, old = self._lru.popitem(last=False)
+            self.nbytes -= old.nbytes
+
+
+def get_model(backend: str = EMBEDDING_BACKEND) -> "SentenceTransformer":
+    """Return the embedding model for ``backend`` (one instance per backend)."""
+    if backend not in _models:
+        print(f"  Loading model: {EMBEDDING_MODEL} ({backend})...")
+        _models[backend] = _load_model(backend)
+    return _models[backend]
+
+
+def _load_model(backend: str) -> "SentenceTransformer":
+    # All backends share the same tokenizer, mean pooling and normalize step;
+    # only the transformer forward pass differs.
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "torch":
+        return SentenceTransformer(EMBEDDING_MODEL)
+    if backend == "onnx":
+        return SentenceTransformer(EMBEDDING_MODEL, backend="onnx")
+    if backend == "onnx-int8":
+        return _load_quantized_onnx()
+    raise ValueError(
+        f"Unknown embedding backend {backend!r}, expected one of {BACKENDS}"
+    )
+
+
+def _load_quantized_onnx() -> "SentenceTransformer":
+    """Load an int8 dynamically quantized ONNX export, exporting it on first use."""
+    from sentence_transformers import (
+        SentenceTransformer,
+        export_dynamic_quantized_onnx_model,
+    )
+
+    arch = "arm64" if platform.machine() in ("arm64", "aarch64") else "avx2"
+    path = os.path.join(CACHE_DIR, "onnx", EMBEDDING_MODEL.replace("/", "__"))
+    file_name = f"onnx/model_qint8_{arch}.onnx"
+    if not os.path.exists(os.path.join(path, file_name)):
+        print(f"  Exporting int8 ONNX model ({arch}) to {path}...")
+        model = SentenceTransformer(EMBEDDING_MODEL, backend="onnx")
+        model.save(path)
+        export_dynamic_quantized_onnx_model(model, arch, path)
+    return SentenceTransformer(
+        path, backend="onnx", model_kwargs={"file_name": file_name}
+    )
+
+
+def compare_backends(
+    texts: list[str],
+    backends: tuple[str, ...] = BACKENDS,
+    batch_size: int = EMBEDDING_BATCH_SIZE,
+) -> list[dict]:
+    """Encode ``texts`` with each backend and compare against torch.
+
+    Returns one row per backend with throughput (sentences/sec) and the
+    min/mean cosine similarity of its vectors to the torch vectors.
+    """
+    reference = None
+    rows = []
+    for backend in ("torch", *(b for b in backends if b != "torch")):
+        model = get_model(backend)
+        model.encode(texts[:batch_size], normalize_embeddings=True)  # warm-up
+        t0 = time.perf_counter()
+        vectors = model.encode(texts, batch_size=batch_size, normalize_embeddings=True)
+        secs = time.perf_counter() - t0
+        if reference is None:
+            reference = vectors
+        cosine = np.sum(vectors * reference, axis=1)
+        rows.append(
+            {
+                "backend": backend,
+                "sentences_per_sec": len(texts) / secs,
+                "min_cosine": float(cosine.min()),
+                "mean_cosine": float(cosine.mean()),
+            }
+        )
+    return rows
+
+
+def check_backend_parity(
+    backend: str, texts: list[str], min_cosine: float = 0.99
+) -> float:
+    """Raise if ``backend`` drifts from torch on ``texts``; returns the min cosine."""
+    row = compare_backends(texts, backends=(backend,))[-1]
+    if row["min_cosine"] < min_cosine:
+        raise RuntimeError(
+            f"{backend} backend parity check failed: min cosine "
+            f"{row['min_cosine']:.4f} < {min_cosine}"
+        )
+    return row["min_cosine"]
+
+
+def _get_store() -> VectorStore:
+    """Return the content-addressed store for the configured model (singleton)."""
+    global _store
+    if _store is None:
+        slug = EMBEDDING_MODEL.replace("/", "__")
+        _store = VectorStore(f"embeddings-{slug}-{EMBEDDING_DIM}", EMBEDDING_DIM)
+    return _store
+
+
+def _get_query_cache() -> QueryCache:
+    global _query_cache
+    if _query_cache is None:
+        slug = EMBEDDING_MODEL.replace("/", "__")
+        store = VectorStore(f"queries-{slug}-{EMBEDDING_DIM}", EMBEDDING_DIM)
+        _query_cache = QueryCache(store, QUERY_CACHE_MAX_BYTES)
+    return _query_cache
+
+
+def query_cache_stats() -> dict:
+    """Hit/miss counters and size of the query embedding cache."""
+    cache = _get_query_cache()
+    return {
+        **cache.stats,
+        "memory_entries": len(cache._lru),
+        "memory_bytes": cache.nbytes,
+        "disk_entries": len(cache.store),
+    }
 
-    model = get_model()
-    texts = [f"{m['title']}. {m['description']}" for m in movies]
-    print(texts)
-    print(f"  Generating embeddings for {len(texts)} movies...")
-    vectors = model.encode(texts, show_progress_bar=True, normalize_embeddings=True)
-    result = {m["id"]: vec.tolist() for m, vec in zip(movies, vectors)}
-    print(result)
 
-    with open(path, "w") as f:
-        json.dump(result, f)
-    print(f"  Cached to {path}")
-    return result
+def _model_id() -> str:
+    """Model identity for cache keys; quantized/ONNX output is not bit-identical."""
+    if EMBEDDING_BACKEND == "torch":
+        return EMBEDDING_MODEL
+    return f"{EMBEDDING_MODEL}+{EMBEDDING_BACKEND}"
+
+
+def embedding_key(text: str) -> str:
+    """Cache key for ``text`` under the configured model, backend and dimension."""
+    payload = f"{_model_id()}\x00{EMBEDDING_DIM}\x00{text}".encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def movie_text(movie: dict) -> str:
+    """Text that is embedded for a movie record."""
+    return f"{movie['title']}. {movie['description']}"
+
+
+def _encode(texts: list[str], batch_size: int = EMBEDDING_BATCH_SIZE) -> np.ndarray:
+    """Encode via the local embedding daemon if one is running, else in-process."""
+    vectors = remote_encode(texts, _model_id())
+    if vectors is None:
+        vectors = get_model().encode(
+            texts, batch_size=batch_size, normalize_embeddings=True
+        )
+    return vectors
+
+
+def _init_worker(backend: str, workers: int) -> None:
+    """Pool initializer: split CPU threads between workers and load the model once."""
+    try:
+        import torch
+
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // workers))
+    except ImportError:
+        pass
+    get_model(backend)
+
+
+def _encode_chunk(texts: list[str], backend: str) -> np.ndarray:
+    model = get_model(backend)
+    return model.encode(
+        texts, batch_size=EMBEDDING_BATCH_SIZE, normalize_embeddings=True
+    )
+
+
+def _uncached_chunks(
+    records: Iterable[dict],
+    text_fn: Callable[[dict], str],
+    chunk_size: int,
+    stats: dict,
+    keys_out: list[str] | None = None,
+) -> Iterator[tuple[list[str], list[str]]]:
+    """Yield (keys, texts) chunks of records whose embedding is not stored yet."""
+    store = _get_store()
+    chunk: dict[str, str] = {}
+    records = iter(records)
+    while batch := list(itertools.islice(records, chunk_size)):
+        texts = [text_fn(r) for r in batch]
+        keys = [embedding_key(t) for t in texts]
+        if keys_out is not None:
+            keys_out.extend(keys)
+        stats["records"] += len(batch)
+        for key, text, row in zip(keys, texts, store.rows(keys).tolist()):
+            if row >= 0 or key in chunk:
+                stats["cached"] += 1
+                continue
+            chunk[key] = text
+            if len(chunk) >= chunk_size:
+                yield list(chunk), list(chunk.values())
+                chunk = {}
+    if chunk:
+        yield list(chunk), list(chunk.values())
+
+
+def encode_stream(
+    records: Iterable[dict],
+    text_fn: Callable[[dict], str] = movie_text,
+    workers: int = EMBEDDING_WORKERS,
+    chunk_size: int = EMBEDDING_CHUNK_SIZE,
+    keys_out: list[str] | None = None,
+) -> dict:
+    """Encode every record not yet cached, appending results to the store.
+
+    Records are read lazily and at most ``2 * workers`` chunks are in flight,
+    so memory is bounded by the chunk size rather than the corpus size. With
+    ``workers > 1`` chunks are sharded across processes that each hold one
+    model copy. Returns counters: records seen, cached, encoded, seconds.
+    ``keys_out``, if given, receives every record's cache key in order.
+    """
+    store = _get_store()
+    stats = {"records": 0, "cached": 0, "encoded": 0, "seconds": 0.0}
+    chunks = _uncached_chunks(records, text_fn, chunk_size, stats, keys_out)
+    t0 = time.perf_counter()
+
+    if workers <= 1:
+        for keys, texts in chunks:
+            store.append(keys, _encode(texts))
+            stats["encoded"] += len(keys)
+    else:
+        # spawn, not fork: forked torch/tokenizer thread pools can deadlock.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(EMBEDDING_BACKEND, workers),
+        ) as pool:
+            inflight = {}
+            for keys, texts in chunks:
+                if len(inflight) >= 2 * workers:
+                    done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        done_keys = inflight.pop(future)
+                        store.append(done_keys, future.result())
+                        stats["encoded"] += len(done_keys)
+                inflight[pool.submit(_encode_chunk, texts, EMBEDDING_BACKEND)] = keys
+            for future, done_keys in inflight.items():
+                store.append(done_keys, future.result())
+                stats["encoded"] += len(done_keys)
+
+    stats["seconds"] = time.perf_counter() - t0
+    return stats
+
+
+def embed_records(
+    records: list[dict], text_fn: Callable[[dict], str] = movie_text
+) -> np.ndarray:
+    """Embeddings for ``records`` in order; cached rows are reused, the rest encoded."""
+    keys: list[str] = []
+    encode_stream(
+        records, text_fn, workers=1, chunk_size=max(len(records), 1), keys_out=keys
+    )
+    store = _get_store()
+    return np.asarray(store.matrix[store.rows(keys)])
+
+
+def generate_movie_embeddings(movies: list[dict]) -> EmbeddingMatrix:
+    """Generate embeddings for movies. Returns {movie_id: float32 row view}.
+
+    Only movies whose (model, dimension, text) key is not cached yet are
+    encoded, so editing or adding a record costs one encode, not a full pass.
+    """
+    keys: list[str] = []
+    stats = encode_stream(movies, keys_out=keys)  # hashes each text once
+    store = _get_store()
+    if stats["encoded"] == 0:
+        print("  Using cached movie embeddings.")
+    else:
+        rate = stats["encoded"] / max(stats["seconds"], 1e-9)
+        print(
+            f"  Embedded {stats['encoded']} of {stats['records']} movies "
+            f"({stats['cached']} cached) in {stats['seconds']:.1f}s "
+            f"({rate:.0f}/sec) → {store.path}"
+        )
+
+    return EmbeddingMatrix(store.matrix, [m["id"] for m in movies], store.rows(keys))
 
 
 def generate_query_embedding(text: str) -> list[float]:
-    """Generate a single query embedding."""
-    model = get_model()
-    vec = model.encode(text, normalize_embeddings=True)
+    """Generate a single query embedding (served from the query cache if known)."""
+    cache = _get_query_cache()
+    key = embedding_key(text)
+    vec = cache.get(key)
+    if vec is None:
+        vec = _encode([text])[0].astype(np.float32)
+        cache.put(key, vec)
     return vec.tolist()
+
+
+def generate_query_embeddings(
+    texts: list[str], batch_size: int = EMBEDDING_BATCH_SIZE
+) -> np.ndarray:
+    """Embed many texts at once. Returns a (len(texts), dim) float32 matrix.
+
+    Duplicates are encoded once (first occurrence wins the slot), cached texts
+    are not encoded at all, and the rest go through the model in batches.
+    """
+    cache = _get_query_cache()
+    unique = list(dict.fromkeys(texts))
+    keys = [embedding_key(t) for t in unique]
+    vectors = np.empty((len(unique), EMBEDDING_DIM), dtype=np.float32)
+
+    todo = []
+    for i, key in enumerate(keys):
+        vec = cache.get(key)
+        if vec is None:
+            todo.append(i)
+        else:
+            vectors[i] = vec
+
+    if todo:
+        vectors[todo] = _encode([unique[i] for i in todo], batch_size)
+        cache.put_many([keys[i] for i in todo], vectors[todo])
+
+    slot = {t: i for i, t in enumerate(unique)}
+    return vectors[[slot[t] for t in texts]]
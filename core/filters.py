@@ -0,0 +1,312 @@
+"""One filter expression, compiled to Qdrant, S3 Vectors, or a local NumPy mask.
+
+Build expressions with ``field()`` and the ``&``, ``|``, ``~`` operators::
+
+    flt = (field("genre") == "Sci-Fi") & (field("year") >= 2010)
+    qc.query_points(..., query_filter=to_qdrant(flt))
+    sc.query_vectors(..., filter=to_s3v(flt))
+    mask = evaluate(flt, columns)
+    keep = match_records(flt, metadata_dicts)  # S3 semantics, e.g. list_vectors
+
+Expressions are frozen and hashable, so each compiler caches its output per
+expression: a filter reused across queries is compiled once. Compiled
+objects are shared — don't mutate them.
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache, reduce
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from qdrant_client import models
+
+RANGE_OPS = ("gt", "gte", "lt", "lte")
+NEGATED = {
+    "eq": "ne",
+    "ne": "eq",
+    "in": "nin",
+    "nin": "in",
+    "gt": "lte",
+    "lte": "gt",
+    "gte": "lt",
+    "lt": "gte",
+}
+
+
+class Expr:
+    """Base of all filter expressions."""
+
+    def __and__(self, other: "Expr") -> "Expr":
+        return And(_flatten(And, (self, other)))
+
+    def __or__(self, other: "Expr") -> "Expr":
+        return Or(_flatten(Or, (self, other)))
+
+    def __invert__(self) -> "Expr":
+        return Not(self)
+
+
+@dataclass(frozen=True)
+class Cond(Expr):
+    """``field <op> value``; ``op`` is a key of NEGATED, ``value`` a tuple for in/nin."""
+
+    field: str
+    op: str
+    value: Any
+
+    def __str__(self) -> str:
+        return f"{self.field} {self.op} {self.value!r}"
+
+
+@dataclass(frozen=True)
+class And(Expr):
+    items: tuple[Expr, ...]
+
+    def __str__(self) -> str:
+        return "(" + " AND ".join(map(str, self.items)) + ")"
+
+
+@dataclass(frozen=True)
+class Or(Expr):
+    items: tuple[Expr, ...]
+
+    def __str__(self) -> str:
+        return "(" + " OR ".join(map(str, self.items)) + ")"
+
+
+@dataclass(frozen=True)
+class Not(Expr):
+    item: Expr
+
+    def __str__(self) -> str:
+        return f"NOT {self.item}"
+
+
+def _flatten(kind: type, items: Iterable[Expr]) -> tuple[Expr, ...]:
+    out = []
+    for item in items:
+        out.extend(item.items if isinstance(item, kind) else (item,))
+    return tuple(out)
+
+
+class field:
+    """Condition builder: ``field("year") >= 2010``, ``field("genre").isin(...)``."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def _cond(self, op: str, value) -> Cond:
+        if isinstance(value, (list, tuple, set, frozenset, dict)):
+            raise TypeError(
+                f"field({self.name!r}) {op} takes a single value, got "
+                f"{type(value).__name__}; use .isin() / .notin() for several"
+            )
+        return Cond(self.name, op, value)
+
+    def __eq__(self, value) -> Cond:  # type: ignore[override]
+        return self._cond("eq", value)
+
+    def __ne__(self, value) -> Cond:  # type: ignore[override]
+        return self._cond("ne", value)
+
+    def __gt__(self, value) -> Cond:
+        return self._cond("gt", value)
+
+    def __ge__(self, value) -> Cond:
+        return self._cond("gte", value)
+
+    def __lt__(self, value) -> Cond:
+        return self._cond("lt", value)
+
+    def __le__(self, value) -> Cond:
+        return self._cond("lte", value)
+
+    def isin(self, values: Iterable) -> Cond:
+        return Cond(self.name, "in", tuple(values))
+
+    def notin(self, values: Iterable) -> Cond:
+        return Cond(self.name, "nin", tuple(values))
+
+
+def all_of(*items: Expr) -> Expr:
+    return reduce(lambda a, b: a & b, items)
+
+
+def any_of(*items: Expr) -> Expr:
+    return reduce(lambda a, b: a | b, items)
+
+
+# --- Qdrant ---
+
+
+def _qdrant_condition(expr: Expr):
+    from qdrant_client import models
+
+    if isinstance(expr, Cond):
+        if expr.op == "eq" and isinstance(expr.value, float):
+            # MatchValue takes only str / int / bool: a float is a point range.
+            return models.FieldCondition(
+                key=expr.field, range=models.Range(gte=expr.value, lte=expr.value)
+            )
+        if expr.op == "eq":
+            return models.FieldCondition(
+                key=expr.field, match=models.MatchValue(value=expr.value)
+            )
+        if expr.op == "in" and any(isinstance(v, float) for v in expr.value):
+            return to_qdrant(any_of(*(Cond(expr.field, "eq", v) for v in expr.value)))
+        if expr.op == "in":
+            return models.FieldCondition(
+                key=expr.field, match=models.MatchAny(any=list(expr.value))
+            )
+        if expr.op in RANGE_OPS:
+            return models.FieldCondition(
+                key=expr.field, range=models.Range(**{expr.op: expr.value})
+            )
+    return to_qdrant(expr)  # ne / nin / compound → nested Filter
+
+
+@lru_cache(maxsize=256)
+def to_qdrant(expr: Expr) -> "models.Filter":
+    """Compile to a Qdrant ``models.Filter`` (cached per expression)."""
+    from qdrant_client import models
+
+    if isinstance(expr, And):
+        return models.Filter(must=[_qdrant_condition(e) for e in expr.items])
+    if isinstance(expr, Or):
+        return models.Filter(should=[_qdrant_condition(e) for e in expr.items])
+    if isinstance(expr, Not):
+        return models.Filter(must_not=[_qdrant_condition(expr.item)])
+    if expr.op in ("ne", "nin"):
+        positive = Cond(expr.field, NEGATED[expr.op], expr.value)
+        return models.Filter(must_not=[_qdrant_condition(positive)])
+    return models.Filter(must=[_qdrant_condition(expr)])
+
+
+# --- S3 Vectors ---
+
+
+def _push_not(expr: Expr) -> Expr:
+    """Eliminate Not (S3 Vectors has no ``$not``) with De Morgan's laws."""
+    if isinstance(expr, Cond):
+        return expr
+    if isinstance(expr, And):
+        return And(tuple(_push_not(e) for e in expr.items))
+    if isinstance(expr, Or):
+        return Or(tuple(_push_not(e) for e in expr.items))
+    inner = expr.item
+    if isinstance(inner, Cond):
+        return Cond(inner.field, NEGATED[inner.op], inner.value)
+    if isinstance(inner, Not):
+        return _push_not(inner.item)
+    flipped = tuple(_push_not(Not(e)) for e in inner.items)
+    return Or(flipped) if isinstance(inner, And) else And(flipped)
+
+
+def _s3v_doc(expr: Expr) -> dict:
+    if isinstance(expr, And):
+        return {"$and": [_s3v_doc(e) for e in expr.items]}
+    if isinstance(expr, Or):
+        return {"$or": [_s3v_doc(e) for e in expr.items]}
+    if expr.op == "eq":
+        return {expr.field: expr.value}
+    value = list(expr.value) if expr.op in ("in", "nin") else expr.value
+    return {expr.field: {f"${expr.op}": value}}
+
+
+@lru_cache(maxsize=256)
+def to_s3v(expr: Expr) -> dict:
+    """Compile to an S3 Vectors metadata filter document (cached per expression).
+
+    Negated range conditions flip to the complementary operator, so a record
+    missing the field matches ``~(year >= 2010)`` locally and in Qdrant but
+    not in S3 Vectors.
+    """
+    return _s3v_doc(_push_not(expr))
+
+
+# --- Local evaluation ---
+
+
+def condition_mask(column, op: str, value) -> np.ndarray:
+    """Mask for ``column <op> value``.
+
+    ``column`` is an ndarray (float NaN / object None = missing) or a column
+    object with its own ``where(op, value)``, e.g. a dictionary-encoded one.
+    """
+    if not isinstance(column, np.ndarray):
+        return column.where(op, value)
+    if op == "eq":
+        return column == value
+    if op == "ne":
+        return column != value
+    if op in ("in", "nin"):
+        if column.dtype == object:  # None / mixed types: no sort-based isin
+            hits = np.fromiter(
+                (v in value for v in column), dtype=bool, count=len(column)
+            )
+        else:
+            hits = np.isin(column, list(value))
+        return hits if op == "in" else ~hits
+    if column.dtype == object:
+        present = np.array([v is not None for v in column], dtype=bool)
+        out = np.zeros(len(column), dtype=bool)
+        out[present] = condition_mask(np.array(column[present].tolist()), op, value)
+        return out
+    if op == "gt":
+        return column > value
+    if op == "gte":
+        return column >= value
+    if op == "lt":
+        return column < value
+    return column <= value
+
+
+def evaluate(expr: Expr, columns: Mapping) -> np.ndarray:
+    """Boolean mask of the rows of ``columns`` (field → column) that ``expr`` selects."""
+    n = len(next(iter(columns.values())))
+    if isinstance(expr, Cond):
+        column = columns.get(expr.field)
+        if column is None:  # nobody has the field: only negations match
+            return np.full(n, expr.op in ("ne", "nin"))
+        return np.asarray(condition_mask(column, expr.op, expr.value), dtype=bool)
+    if isinstance(expr, And):
+        return np.logical_and.reduce([evaluate(e, columns) for e in expr.items])
+    if isinstance(expr, Or):
+        return np.logical_or.reduce([evaluate(e, columns) for e in expr.items])
+    return ~evaluate(expr.item, columns)
+
+
+def fields(expr: Expr) -> set[str]:
+    """Every field ``expr`` reads."""
+    if isinstance(expr, Cond):
+        return {expr.field}
+    if isinstance(expr, Not):
+        return fields(expr.item)
+    return set().union(*(fields(e) for e in expr.items))
+
+
+@lru_cache(maxsize=256)
+def _s3v_normal_form(expr: Expr) -> tuple[Expr, tuple[str, ...]]:
+    expr = _push_not(expr)
+    return expr, tuple(sorted(fields(expr)))
+
+
+def match_records(expr: Expr, records: list[dict]) -> np.ndarray:
+    """Mask of the ``records`` (metadata dicts) that ``expr`` selects.
+
+    Uses the negation-free form sent to S3 Vectors, so filtering
+    ``list_vectors`` pages locally keeps S3's semantics for missing fields.
+    """
+    expr, names = _s3v_normal_form(expr)
+    if not records:
+        return np.zeros(0, dtype=bool)
+    columns = {
+        name: np.fromiter(
+            (r.get(name) for r in records), dtype=object, count=len(records)
+        )
+        for name in names
+    }
+    return evaluate(expr, columns)
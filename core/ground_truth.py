@@ -0,0 +1,127 @@
+"""Exact brute-force kNN over cached embeddings — ground truth for recall checks.
+
+Vectors are L2-normalized, so cosine similarity is a dot product. The corpus
+matrix is streamed once in row blocks; each block is scored against all
+queries with a float32 matmul, reduced to top-k with ``argpartition`` and
+merged into a running top-k per query. Memory is O(block x queries), never
+O(corpus x queries), so it runs over memory-mapped matrices of millions of rows.
+"""
+
+from collections.abc import Callable, Iterable
+
+import numpy as np
+
+from core.embeddings import EmbeddingMatrix
+
+BLOCK_ROWS = 65_536  # corpus rows scored per matmul
+QUERY_BATCH = 1_024  # queries scored per matmul
+
+
+def _topk(scores: np.ndarray, idx: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Row-wise top-k (unsorted) of ``scores``, carrying ``idx`` along."""
+    n = scores.shape[1]
+    if n > k:
+        # Partition for the largest k in place of negating (saves a full copy).
+        part = np.argpartition(scores, n - k, axis=1)[:, n - k :]
+        scores = np.take_along_axis(scores, part, axis=1)
+        idx = np.take_along_axis(idx, part, axis=1)
+    return scores, idx
+
+
+class ExactIndex:
+    """Exact cosine top-k over selected rows of a float32 matrix.
+
+    ``ids[i]`` names position ``i``; filter masks are boolean arrays aligned
+    with ``ids``.
+    """
+
+    def __init__(self, matrix: np.ndarray, ids: list[str], rows: np.ndarray):
+        order = np.argsort(rows, kind="stable")  # sequential reads of the memmap
+        self.matrix = matrix
+        self.rows = np.asarray(rows)[order]
+        self.ids = [ids[i] for i in order]
+        # Content-addressed ids may share a row, so check every step, not the span.
+        self._contiguous = len(self.rows) > 0 and bool(np.all(np.diff(self.rows) == 1))
+
+    @classmethod
+    def from_embeddings(cls, embeddings: EmbeddingMatrix) -> "ExactIndex":
+        return cls(embeddings.matrix, embeddings.ids, embeddings.rows)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def mask(self, predicate: Callable[[str], bool]) -> np.ndarray:
+        """Boolean filter mask from a per-id predicate."""
+        return np.fromiter((predicate(i) for i in self.ids), bool, len(self.ids))
+
+    def _block(self, lo: int, hi: int) -> np.ndarray:
+        if self._contiguous:
+            start = self.rows[0]
+            return np.asarray(self.matrix[start + lo : start + hi], dtype=np.float32)
+        return np.asarray(self.matrix[self.rows[lo:hi]], dtype=np.float32)
+
+    def search(
+        self, queries: np.ndarray, k: int, mask: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Exact top-k for every query. Returns (positions, scores), both (Q, k).
+
+        Rows are sorted by descending score. Where fewer than ``k`` rows pass
+        ``mask``, the tail is padded with position -1 and score -inf.
+        """
+        queries = np.ascontiguousarray(queries, dtype=np.float32).reshape(
+            -1, self.matrix.shape[1]
+        )
+        n_q = len(queries)
+        best_s = np.full((n_q, k), -np.inf, dtype=np.float32)
+        best_i = np.full((n_q, k), -1, dtype=np.int64)
+
+        for lo in range(0, len(self), BLOCK_ROWS):
+            hi = min(lo + BLOCK_ROWS, len(self))
+            keep = None if mask is None else mask[lo:hi]
+            if keep is not None and not keep.any():
+                continue
+            block = self._block(lo, hi)
+            positions = np.arange(lo, hi)
+            if keep is not None and not keep.all():
+                block, positions = block[keep], positions[keep]
+
+            for qlo in range(0, n_q, QUERY_BATCH):
+                qhi = min(qlo + QUERY_BATCH, n_q)
+                scores = queries[qlo:qhi] @ block.T
+                idx = np.broadcast_to(positions, scores.shape)
+                scores, idx = _topk(scores, idx, k)
+                scores = np.concatenate([best_s[qlo:qhi], scores], axis=1)
+                idx = np.concatenate([best_i[qlo:qhi], idx], axis=1)
+                best_s[qlo:qhi], best_i[qlo:qhi] = _topk(scores, idx, k)
+
+        order = np.argsort(-best_s, axis=1, kind="stable")
+        return (
+            np.take_along_axis(best_i, order, axis=1),
+            np.take_along_axis(best_s, order, axis=1),
+        )
+
+    def search_ids(
+        self, queries: np.ndarray, k: int, mask: np.ndarray | None = None
+    ) -> list[list[tuple[str, float]]]:
+        """Like :meth:`search`, but returns [(id, score), ...] per query."""
+        positions, scores = self.search(queries, k, mask)
+        return [
+            [(self.ids[p], float(s)) for p, s in zip(prow, srow) if p >= 0]
+            for prow, srow in zip(positions, scores)
+        ]
+
+
+def ground_truth(
+    embeddings: EmbeddingMatrix,
+    queries: np.ndarray,
+    k: int,
+    records: Iterable[dict] | None = None,
+    predicate: Callable[[dict], bool] | None = None,
+) -> list[list[str]]:
+    """Exact top-k ids per query, optionally only over records matching ``predicate``."""
+    index = ExactIndex.from_embeddings(embeddings)
+    mask = None
+    if predicate is not None:
+        by_id = {r["id"]: r for r in records}
+        mask = index.mask(lambda i: predicate(by_id[i]))
+    return [[i for i, _ in hits] for hits in index.search_ids(queries, k, mask)]
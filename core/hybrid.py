@@ -0,0 +1,144 @@
+"""Hybrid (dense + keyword) search with Reciprocal Rank Fusion, both backends.
+
+Qdrant: dense + sparse named vectors in one collection (sparse vectors from
+``core.sparse`` with the server-side IDF modifier), fused by
+``prefetch=[dense, sparse]`` + ``FusionQuery(Fusion.RRF)``.
+
+S3 Vectors mirrors that: the dense list comes from S3 Vectors, the keyword
+list from the local BM25 index (``core.bm25``), and both are fused with
+Qdrant's RRF formula. The BM25 lookup runs while the S3 request is in
+flight, so fusion costs about one S3 round trip.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.async_search import Hit, Result, s3v_query
+from core.bm25 import BM25Index
+from core.config import EMBEDDING_DIM, RRF_K, qdrant_id
+from core.embeddings import EmbeddingMatrix
+from core.sparse import SparseEncoder
+
+
+def movie_document(movie: dict) -> str:
+    """Text indexed for keyword search: title, description and genre."""
+    return f"{movie['title']} {movie['description']} {movie['genre']}"
+
+
+def movie_index(movies: list[dict], name: str = "bm25-movies") -> BM25Index:
+    """Persistent BM25 index over ``movies``, rebuilt only when they change."""
+    return BM25Index.open(
+        name, [m["id"] for m in movies], [movie_document(m) for m in movies]
+    )
+
+
+def create_qdrant_hybrid_collection(
+    qc,
+    name: str,
+    movies: list[dict],
+    embeddings: EmbeddingMatrix,
+    encoder: SparseEncoder,
+) -> None:
+    """(Re)create ``name`` with "dense" and IDF-weighted "sparse" vectors."""
+    from qdrant_client import models
+
+    qc.recreate_collection(
+        name,
+        vectors_config={
+            "dense": models.VectorParams(
+                size=EMBEDDING_DIM, distance=models.Distance.COSINE
+            )
+        },
+        sparse_vectors_config={
+            "sparse": models.SparseVectorParams(modifier=models.Modifier.IDF)
+        },
+    )
+    sparse = encoder.encode_documents([movie_document(m) for m in movies])
+    points = [
+        models.PointStruct(
+            id=qdrant_id(m["id"]),
+            vector={
+                "dense": embeddings[m["id"]].tolist(),
+                "sparse": models.SparseVector(indices=indices, values=values),
+            },
+            payload={"title": m["title"], "genre": m["genre"], "year": m["year"]},
+        )
+        for m, (indices, values) in zip(movies, sparse)
+    ]
+    qc.upsert(name, points)
+
+
+def qdrant_hybrid_search(
+    qc,
+    name: str,
+    encoder: SparseEncoder,
+    query_text: str,
+    dense_vec: list[float],
+    limit: int = 5,
+    prefetch_limit: int = 10,
+) -> Result:
+    """Server-side RRF of the dense and sparse prefetches, best first."""
+    from qdrant_client import models
+
+    indices, values = encoder.encode_query(query_text)
+    t0 = time.perf_counter()
+    res = qc.query_points(
+        name,
+        prefetch=[
+            models.Prefetch(query=dense_vec, using="dense", limit=prefetch_limit),
+            models.Prefetch(
+                query=models.SparseVector(indices=indices, values=values),
+                using="sparse",
+                limit=prefetch_limit,
+            ),
+        ],
+        query=models.FusionQuery(fusion=models.Fusion.RRF),
+        limit=limit,
+        with_payload=True,
+    )
+    ms = (time.perf_counter() - t0) * 1000
+    return Result([Hit(p.id, p.score, p.payload) for p in res.points], ms)
+
+
+def rrf(rankings: list[list], limit: int, k: int = RRF_K) -> list[tuple]:
+    """Fuse ranked key lists: score(key) = sum of 1 / (k + rank), rank from 0."""
+    scores: dict = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda kv: -kv[1])[:limit]
+
+
+def s3v_hybrid_search(
+    sc,
+    index: BM25Index,
+    query_text: str,
+    dense_vec: list[float],
+    limit: int = 5,
+    prefetch_limit: int = 10,
+) -> tuple[list[Hit], dict]:
+    """RRF of S3 Vectors dense and local BM25 results, best first.
+
+    Hits carry the RRF score and S3 metadata (empty for keyword-only hits).
+    Stats: dense_ms, sparse_ms, fusion_ms and ms (wall).
+    """
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(1) as pool:
+        dense = pool.submit(s3v_query, sc, dense_vec, prefetch_limit)
+        t1 = time.perf_counter()
+        sparse = index.search(query_text, prefetch_limit)
+        sparse_ms = (time.perf_counter() - t1) * 1000
+        dense = dense.result()
+
+    t1 = time.perf_counter()
+    payloads = {h.key: h.payload for h in dense.hits}
+    fused = rrf([[h.key for h in dense.hits], [key for key, _ in sparse]], limit)
+    hits = [Hit(key, score, payloads.get(key, {})) for key, score in fused]
+    fusion_ms = (time.perf_counter() - t1) * 1000
+    stats = {
+        "dense_ms": dense.ms,
+        "sparse_ms": sparse_ms,
+        "fusion_ms": fusion_ms,
+        "ms": (time.perf_counter() - t0) * 1000,
+    }
+    return hits, stats
@@ -0,0 +1,65 @@
+"""Retrieval quality and latency metrics for comparing results with ground truth."""
+
+import math
+
+import numpy as np
+
+
+def recall_at_k(retrieved: list[str], truth: list[str], k: int) -> float:
+    """Fraction of the true top-k that appears in the retrieved top-k."""
+    expected = truth[:k]
+    if not expected:
+        return 1.0
+    return len(set(retrieved[:k]) & set(expected)) / len(expected)
+
+
+def ndcg_at_k(retrieved: list[str], truth: list[str], k: int) -> float:
+    """nDCG@k with binary relevance: a hit is any id in the true top-k."""
+    relevant = set(truth[:k])
+    if not relevant:
+        return 1.0
+    dcg = sum(
+        1 / math.log2(rank + 2) for rank, i in enumerate(retrieved[:k]) if i in relevant
+    )
+    idcg = sum(1 / math.log2(rank + 2) for rank in range(len(relevant)))
+    return dcg / idcg
+
+
+def rank_overlap(
+    retrieved: list[str], truth: list[str], k: int, p: float = 0.9
+) -> float:
+    """Rank-biased overlap of two top-k lists (1.0 = same items in the same order).
+
+    Agreement at each depth is weighted by ``p ** (depth - 1)``, so disagreement
+    near the top costs more than disagreement near the tail.
+    """
+    a, b = retrieved[:k], truth[:k]
+    if not a and not b:
+        return 1.0
+    seen_a, seen_b = set(), set()
+    overlap, score, norm = 0, 0.0, 0.0
+    for depth in range(1, k + 1):
+        x = a[depth - 1] if depth <= len(a) else None
+        y = b[depth - 1] if depth <= len(b) else None
+        if x is not None:
+            overlap += x in seen_b
+            seen_a.add(x)
+        if y is not None:
+            overlap += y in seen_a
+            seen_b.add(y)
+        weight = p ** (depth - 1)
+        score += weight * overlap / depth
+        norm += weight
+    return score / norm
+
+
+def latency_percentiles(samples_ms: list[float]) -> dict[str, float]:
+    """p50 / p99 / mean of latency samples in milliseconds."""
+    if not samples_ms:
+        return {"p50": 0.0, "p99": 0.0, "mean": 0.0}
+    arr = np.asarray(samples_ms)
+    return {
+        "p50": float(np.percentile(arr, 50)),
+        "p99": float(np.percentile(arr, 99)),
+        "mean": float(arr.mean()),
+    }
@@ -0,0 +1,157 @@
+"""Streaming ingest: encode record batches while earlier batches upload.
+
+    records ──▶ encode (main thread) ──┬─▶ queue ──▶ Qdrant bulk_upload
+                                       └─▶ queue ──▶ S3 Vectors put_vectors_bulk
+
+Each encoded batch is fanned out to one bounded queue per backend. A slow
+backend fills its queue and stalls the encoder (backpressure), so memory
+stays at ``queue_depth`` batches per backend. Wall-clock time tends to
+max(encode, slowest upload) instead of their sum.
+"""
+
+import hashlib
+import itertools
+import json
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+
+from core.config import EMBEDDING_CHUNK_SIZE, PIPELINE_QUEUE_DEPTH, qdrant_id
+from core.embeddings import embed_records, embedding_key, movie_text
+from core.metadata import MetadataTable
+from core.qdrant_loader import bulk_upload
+from core.s3v_loader import put_vectors_bulk
+
+HASH_FIELD = "content_hash"  # payload / metadata field written with every record
+
+_DONE = object()
+
+
+def content_hash(record: dict, payload: dict) -> str:
+    """Hash of everything a backend stores for ``record``: its embedding key
+    (model + text) and its payload. Equal hashes mean nothing to re-upload."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(embedding_key(movie_text(record)).encode())
+    h.update(json.dumps(payload, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def _batches(records: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    it = iter(records)
+    while batch := list(itertools.islice(it, size)):
+        yield batch
+
+
+def _drain(q: queue.Queue) -> Iterator[tuple[str, list[float], dict]]:
+    while (batch := q.get()) is not _DONE:
+        yield from batch
+
+
+def _qdrant_sink(client, items: Iterator, size: int | None = None) -> dict:
+    from qdrant_client import models
+
+    points = (
+        models.PointStruct(id=qdrant_id(key), vector=vector, payload=payload)
+        for key, vector, payload in items
+    )
+    return bulk_upload(client, points, size=size)
+
+
+def _s3v_sink(client, items: Iterator) -> dict:
+    vectors = (
+        {"key": key, "data": {"float32": vector}, "metadata": payload}
+        for key, vector, payload in items
+    )
+    return put_vectors_bulk(client, vectors)
+
+
+class _Consumer(threading.Thread):
+    """Runs ``sink`` over a bounded queue; keeps the result or the error."""
+
+    def __init__(self, name: str, sink: Callable, client, depth: int):
+        super().__init__(name=f"ingest-{name}", daemon=True)
+        self.label = name
+        self.queue = queue.Queue(maxsize=depth)
+        self.sink, self.client = sink, client
+        self.stats, self.error = None, None
+        self.seconds = 0.0
+
+    def run(self):
+        t0 = time.perf_counter()
+        try:
+            self.stats = self.sink(self.client, _drain(self.queue))
+        except BaseException as exc:
+            self.error = exc
+        self.seconds = time.perf_counter() - t0
+
+    def offer(self, item) -> bool:
+        """Blocking put; False if the consumer died before taking ``item``."""
+        while self.is_alive():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def put(self, item) -> None:
+        """Blocking put that raises the consumer's error if it has died."""
+        if not self.offer(item):
+            raise RuntimeError(f"{self.label} ingest failed") from self.error
+
+
+def ingest(
+    records: Iterable[dict],
+    qdrant=None,
+    s3v=None,
+    batch_size: int = EMBEDDING_CHUNK_SIZE,
+    queue_depth: int = PIPELINE_QUEUE_DEPTH,
+) -> dict:
+    """Embed ``records`` and load them into every backend client given.
+
+    Returns counters: records, encode_seconds (encoder busy time), seconds
+    (wall clock), and per backend its loader stats plus ``seconds``.
+    ``len(records)``, when available, is the Qdrant loader's size hint.
+    """
+    size = len(records) if hasattr(records, "__len__") else None
+    consumers = [
+        _Consumer(name, sink, client, queue_depth)
+        for name, sink, client in (
+            ("qdrant", partial(_qdrant_sink, size=size), qdrant),
+            ("s3vectors", _s3v_sink, s3v),
+        )
+        if client is not None
+    ]
+    for consumer in consumers:
+        consumer.start()
+
+    stats = {"records": 0, "encode_seconds": 0.0}
+    t0 = time.perf_counter()
+    try:
+        for batch in _batches(records, batch_size):
+            t_enc = time.perf_counter()
+            vectors = embed_records(batch).tolist()
+            payloads = MetadataTable.from_records(batch).payloads()
+            items = [
+                (key, vec, {**payload, HASH_FIELD: content_hash(record, payload)})
+                for record, (key, payload), vec in zip(batch, payloads, vectors)
+            ]
+            stats["encode_seconds"] += time.perf_counter() - t_enc
+            stats["records"] += len(items)
+            for consumer in consumers:
+                consumer.put(items)
+    finally:
+        # Every live consumer gets _DONE and is joined, even if another died.
+        for consumer in consumers:
+            consumer.offer(_DONE)
+        for consumer in consumers:
+            consumer.join()
+
+    for consumer in consumers:
+        if consumer.error is not None:
+            raise RuntimeError(f"{consumer.label} ingest failed") from consumer.error
+        stats[consumer.label] = {**consumer.stats, "seconds": consumer.seconds}
+    stats["seconds"] = time.perf_counter() - t0
+    return stats
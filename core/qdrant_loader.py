@@ -0,0 +1,117 @@
+"""Bulk ingest into Qdrant — stream points with indexing deferred until the end.
+
+Building HNSW while points are still arriving means re-indexing the same
+segments over and over. ``bulk_upload`` switches indexing off
+(``indexing_threshold=0``), streams points through ``upload_points`` (with
+parallel workers for loads known to reach QDRANT_PARALLEL_MIN_POINTS),
+restores the previous threshold and waits for the collection to turn green.
+Upload throughput and time-to-searchable are reported separately.
+"""
+
+import time
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from core.config import (
+    QDRANT_COLLECTION,
+    QDRANT_GREEN_TIMEOUT_S,
+    QDRANT_PARALLEL_MIN_POINTS,
+    QDRANT_UPLOAD_BATCH_SIZE,
+    QDRANT_UPLOAD_PARALLEL,
+)
+
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient, models
+
+DEFAULT_INDEXING_THRESHOLD = 20_000  # Qdrant's documented default, in KB of vectors
+POLL_S = 0.5
+
+
+def _counted(points: Iterable["models.PointStruct"], stats: dict) -> Iterator:
+    for point in points:
+        stats["points"] += 1
+        yield point
+
+
+def wait_for_green(
+    client: "QdrantClient",
+    collection: str = QDRANT_COLLECTION,
+    timeout_s: float = QDRANT_GREEN_TIMEOUT_S,
+) -> float:
+    """Block until ``collection`` is green (optimizations done); returns seconds waited."""
+    from qdrant_client import models
+
+    t0 = time.perf_counter()
+    while True:
+        status = client.get_collection(collection).status
+        if status == models.CollectionStatus.GREEN:
+            return time.perf_counter() - t0
+        if status == models.CollectionStatus.RED:
+            raise RuntimeError(f"Qdrant collection {collection!r} is red")
+        if status == models.CollectionStatus.GREY:
+            # Optimizations pending but not started: an empty update triggers them.
+            client.update_collection(
+                collection, optimizers_config=models.OptimizersConfigDiff()
+            )
+        if time.perf_counter() - t0 > timeout_s:
+            raise TimeoutError(
+                f"Qdrant collection {collection!r} not green after {timeout_s:.0f}s"
+            )
+        time.sleep(POLL_S)
+
+
+def bulk_upload(
+    client: "QdrantClient",
+    points: Iterable["models.PointStruct"],
+    collection: str = QDRANT_COLLECTION,
+    batch_size: int = QDRANT_UPLOAD_BATCH_SIZE,
+    parallel: int = QDRANT_UPLOAD_PARALLEL,
+    size: int | None = None,
+) -> dict:
+    """Upload ``points`` with HNSW indexing deferred; returns when searchable.
+
+    ``size`` is the number of points if known (``len(points)`` by default).
+    Loads of unknown size or under QDRANT_PARALLEL_MIN_POINTS upload in this
+    process: starting ``parallel`` workers would cost more than it saves.
+
+    Returns counters: points, upload_seconds, points_per_sec,
+    searchable_seconds (restore + indexing until green).
+    """
+    from qdrant_client import models
+
+    if size is None and hasattr(points, "__len__"):
+        size = len(points)
+    if size is None or size < QDRANT_PARALLEL_MIN_POINTS:
+        parallel = 1
+
+    config = client.get_collection(collection).config.optimizer_config
+    # Restore exactly what was set; None means the server default was in use.
+    threshold = config.indexing_threshold
+    if threshold is None:
+        threshold = DEFAULT_INDEXING_THRESHOLD
+    client.update_collection(
+        collection, optimizers_config=models.OptimizersConfigDiff(indexing_threshold=0)
+    )
+
+    stats = {"points": 0}
+    t0 = time.perf_counter()
+    try:
+        client.upload_points(
+            collection,
+            _counted(points, stats),
+            batch_size=batch_size,
+            parallel=parallel,
+            wait=True,
+        )
+        stats["upload_seconds"] = time.perf_counter() - t0
+    finally:
+        client.update_collection(
+            collection,
+            optimizers_config=models.OptimizersConfigDiff(indexing_threshold=threshold),
+        )
+
+    t1 = time.perf_counter()
+    wait_for_green(client, collection)
+    stats["searchable_seconds"] = time.perf_counter() - t1
+    stats["points_per_sec"] = stats["points"] / max(stats["upload_seconds"], 1e-9)
+    return stats
@@ -0,0 +1,106 @@
+"""Client-side group-by for S3 Vectors, shaped like Qdrant's query_points_groups.
+
+S3 Vectors has no ``group_by``. Two ways to get "best ``group_size`` hits for
+each of the ``limit`` best groups":
+
+    per_group   one filtered ``query_vectors`` per group value, in parallel.
+                Exact, but costs one call per group.
+    bucket      one ``query_vectors`` at the 100-result cap, bucketed by the
+                group field. One call, but rare or far-away groups can miss.
+
+``strategy="auto"`` counts the groups the filter leaves non-empty (from the
+columnar metadata) and fans out only while that stays within
+S3V_GROUP_MAX_FANOUT. Groups are ordered by their best hit, as in Qdrant.
+"""
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.async_search import Hit, s3v_query
+from core.batch_search import s3v_batch_search
+from core.config import QUERY_CONCURRENCY, S3V_GROUP_MAX_FANOUT, S3V_MAX_TOP_K
+from core.filters import Expr, field
+from core.metadata import Categorical, MetadataTable
+
+
+@dataclass
+class Group:
+    id: str | int
+    hits: list[Hit]
+
+
+def group_counts(table: MetadataTable, name: str, flt: Expr | None = None) -> dict:
+    """Rows per value of ``name`` among the rows ``flt`` selects (non-empty only)."""
+    column, mask = table.columns[name], table.mask(flt)
+    if isinstance(column, Categorical):
+        codes = column.codes[mask]
+        counts = np.bincount(codes[codes >= 0], minlength=len(column.values))
+        return {v: n for v, n in zip(column.values, counts.tolist()) if n}
+    values, counts = np.unique(column[mask], return_counts=True)
+    return dict(zip(values.tolist(), counts.tolist()))
+
+
+def choose_strategy(n_groups: int) -> str:
+    return "per_group" if n_groups <= S3V_GROUP_MAX_FANOUT else "bucket"
+
+
+def _per_group(sc, vec, name, values, group_size, flt, concurrency) -> list[Group]:
+    flts = [(field(name) == v) & flt if flt else field(name) == v for v in values]
+    results = s3v_batch_search(sc, [vec] * len(flts), group_size, flts, concurrency)
+    return [Group(v, r.hits) for v, r in zip(values, results) if r.hits]
+
+
+def _bucket(sc, vec, name, limit, group_size, flt) -> list[Group]:
+    buckets: dict = {}
+    for hit in s3v_query(sc, vec, S3V_MAX_TOP_K, flt).hits:
+        value = hit.payload.get(name)
+        if value is None:
+            continue
+        hits = buckets.setdefault(value, [])
+        if len(hits) < group_size:
+            hits.append(hit)
+    return [Group(v, hits) for v, hits in list(buckets.items())[:limit]]
+
+
+def s3v_query_groups(
+    sc,
+    vec: list[float],
+    group_by: str,
+    table: MetadataTable,
+    limit: int = 10,
+    group_size: int = 1,
+    flt: Expr | None = None,
+    strategy: str = "auto",
+    concurrency: int = QUERY_CONCURRENCY,
+) -> tuple[list[Group], dict]:
+    """Up to ``limit`` groups of up to ``group_size`` hits, best group first.
+
+    Returns (groups, stats) with stats: strategy, groups (non-empty group
+    values under ``flt``), requests, ms.
+    """
+    group_size = min(group_size, S3V_MAX_TOP_K)
+    counts = group_counts(table, group_by, flt)
+    if strategy == "auto":
+        strategy = choose_strategy(len(counts))
+
+    t0 = time.perf_counter()
+    if strategy == "per_group":
+        groups = _per_group(
+            sc, vec, group_by, list(counts), group_size, flt, concurrency
+        )
+        groups = sorted(groups, key=lambda g: g.hits[0].score)[:limit]
+        requests = len(counts)
+    elif strategy == "bucket":
+        groups = _bucket(sc, vec, group_by, limit, group_size, flt)
+        requests = 1
+    else:
+        raise ValueError(f"unknown group strategy {strategy!r}")
+    stats = {
+        "strategy": strategy,
+        "groups": len(counts),
+        "requests": requests,
+        "ms": (time.perf_counter() - t0) * 1000,
+    }
+    return groups, stats
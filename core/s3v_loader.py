@@ -0,0 +1,153 @@
+"""Parallel ``put_vectors`` bulk loader that stays inside S3 Vectors write quotas.
+
+Vectors are read lazily and packed into calls of at most 500 vectors and
+20 MiB. Calls run on a thread pool behind two token buckets (write requests
+per second, vectors per second per index). A throttled call is retried with
+full-jitter exponential backoff and has to pass the buckets again, so a long
+load settles at the quota ceiling instead of failing on the first 429.
+"""
+
+import json
+import random
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from core.config import (
+    S3V_BUCKET_NAME,
+    S3V_INDEX_NAME,
+    S3V_LOAD_WORKERS,
+    S3V_MAX_REQUEST_BYTES,
+    S3V_PUT_MAX_VECTORS,
+    S3V_WRITE_RPS,
+    S3V_WRITE_VECTORS_PER_SEC,
+)
+
+MAX_ATTEMPTS = 8
+BACKOFF_BASE_S = 0.1
+BACKOFF_CAP_S = 10.0
+THROTTLE_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailableException",
+    "SlowDown",
+    "RequestLimitExceeded",
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``acquire`` blocks until the tokens are earned.
+
+    Callers reserve tokens in arrival order and the balance may go negative,
+    so a request larger than ``capacity`` just waits proportionally longer.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = rate if capacity is None else capacity
+        self._tokens = self.capacity
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: float = 1.0) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._stamp) * self.rate
+            )
+            self._stamp = now
+            self._tokens -= n
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay)
+
+
+def _vector_bytes(vector: dict) -> int:
+    """Upper bound on a vector's share of the JSON request body."""
+    floats = vector["data"]["float32"]
+    metadata = json.dumps(vector.get("metadata", {}))
+    return 64 + len(vector["key"]) + 24 * len(floats) + len(metadata)
+
+
+def chunk_vectors(
+    vectors: Iterable[dict],
+    max_vectors: int = S3V_PUT_MAX_VECTORS,
+    max_bytes: int = S3V_MAX_REQUEST_BYTES,
+) -> Iterator[list[dict]]:
+    """Pack vectors into put_vectors-sized chunks (count and payload limits)."""
+    chunk, size = [], 0
+    for vector in vectors:
+        n = _vector_bytes(vector)
+        if chunk and (len(chunk) >= max_vectors or size + n > max_bytes):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(vector)
+        size += n
+    if chunk:
+        yield chunk
+
+
+def _is_throttle(exc: Exception) -> bool:
+    error = getattr(exc, "response", None) or {}
+    code = error.get("Error", {}).get("Code")
+    status = error.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return code in THROTTLE_CODES or status in (429, 503)
+
+
+def _put_chunk(client, chunk, bucket, index, requests, volume) -> int:
+    """put_vectors one chunk under both limiters; returns throttled retries."""
+    for attempt in range(MAX_ATTEMPTS):
+        requests.acquire(1)
+        volume.acquire(len(chunk))
+        try:
+            client.put_vectors(vectorBucketName=bucket, indexName=index, vectors=chunk)
+            return attempt
+        except Exception as exc:
+            if not _is_throttle(exc) or attempt == MAX_ATTEMPTS - 1:
+                raise
+            time.sleep(
+                random.uniform(0, min(BACKOFF_CAP_S, BACKOFF_BASE_S * 2**attempt))
+            )
+
+
+def put_vectors_bulk(
+    client,
+    vectors: Iterable[dict],
+    bucket: str = S3V_BUCKET_NAME,
+    index: str = S3V_INDEX_NAME,
+    workers: int = S3V_LOAD_WORKERS,
+    rps: float = S3V_WRITE_RPS,
+    vectors_per_sec: float = S3V_WRITE_VECTORS_PER_SEC,
+) -> dict:
+    """Load ``vectors`` (put_vectors dicts) with at most ``2 * workers`` calls in flight.
+
+    Returns counters: vectors, calls, retries, seconds, vectors_per_sec.
+    """
+    requests = TokenBucket(rps)
+    volume = TokenBucket(vectors_per_sec)
+    stats = {"vectors": 0, "calls": 0, "retries": 0, "seconds": 0.0}
+    t0 = time.perf_counter()
+
+    def collect(future, size):
+        stats["retries"] += future.result()
+        stats["calls"] += 1
+        stats["vectors"] += size
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        inflight = {}
+        for chunk in chunk_vectors(vectors):
+            if len(inflight) >= 2 * workers:
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future, inflight.pop(future))
+            future = pool.submit(
+                _put_chunk, client, chunk, bucket, index, requests, volume
+            )
+            inflight[future] = len(chunk)
+        for future, size in inflight.items():
+            collect(future, size)
+
+    stats["seconds"] = time.perf_counter() - t0
+    stats["vectors_per_sec"] = stats["vectors"] / max(stats["seconds"], 1e-9)
+    return stats
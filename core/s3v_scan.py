@@ -0,0 +1,145 @@
+"""Parallel, filtered, resumable scan of an S3 Vectors index.
+
+``list_vectors`` cannot filter, and one ``nextToken`` chain is strictly
+sequential. The scan splits the index into ``segmentCount`` segments, each
+its own chain, keeps one page request in flight per segment on up to
+``workers`` threads, filters every page locally with
+``filters.match_records`` and yields pages in arrival order.
+
+Every Page carries a Cursor: the next token of each segment, advanced only
+by pages already yielded. ``scan_vectors(..., cursor=Cursor.loads(saved))``
+picks up where a stopped scan left off without repeating yielded pages.
+"""
+
+import json
+import random
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from core.config import (
+    S3V_BUCKET_NAME,
+    S3V_INDEX_NAME,
+    S3V_LIST_MAX_RESULTS,
+    S3V_LIST_MAX_SEGMENTS,
+    S3V_SCAN_WORKERS,
+)
+from core.filters import Expr, match_records
+from core.s3v_loader import BACKOFF_BASE_S, BACKOFF_CAP_S, MAX_ATTEMPTS, _is_throttle
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Per-segment resume state: next token (None = from the start) and done flag."""
+
+    tokens: tuple[str | None, ...]
+    done: tuple[bool, ...]
+
+    @classmethod
+    def start(cls, segments: int) -> "Cursor":
+        return cls((None,) * segments, (False,) * segments)
+
+    @property
+    def segments(self) -> int:
+        return len(self.tokens)
+
+    @property
+    def finished(self) -> bool:
+        return all(self.done)
+
+    def advance(self, segment: int, token: str | None) -> "Cursor":
+        """Cursor after a page of ``segment`` whose nextToken was ``token``."""
+        tokens, done = list(self.tokens), list(self.done)
+        tokens[segment], done[segment] = token, token is None
+        return Cursor(tuple(tokens), tuple(done))
+
+    def dumps(self) -> str:
+        return json.dumps({"tokens": self.tokens, "done": self.done})
+
+    @classmethod
+    def loads(cls, text: str) -> "Cursor":
+        state = json.loads(text)
+        return cls(tuple(state["tokens"]), tuple(state["done"]))
+
+
+@dataclass
+class Page:
+    vectors: list[dict]  # list_vectors entries that pass the filter
+    scanned: int  # entries listed, before filtering
+    segment: int
+    cursor: Cursor  # resume point after this page
+
+
+def _list_page(client, bucket, index, segment, segments, token, page_size, data):
+    """One list_vectors call, retried with full-jitter backoff when throttled."""
+    kwargs = {"nextToken": token} if token else {}
+    if segments > 1:
+        kwargs.update(segmentCount=segments, segmentIndex=segment)
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return client.list_vectors(
+                vectorBucketName=bucket,
+                indexName=index,
+                maxResults=page_size,
+                returnData=data,
+                returnMetadata=True,
+                **kwargs,
+            )
+        except Exception as exc:
+            if not _is_throttle(exc) or attempt == MAX_ATTEMPTS - 1:
+                raise
+            time.sleep(
+                random.uniform(0, min(BACKOFF_CAP_S, BACKOFF_BASE_S * 2**attempt))
+            )
+
+
+def scan_vectors(
+    client,
+    flt: Expr | None = None,
+    bucket: str = S3V_BUCKET_NAME,
+    index: str = S3V_INDEX_NAME,
+    segments: int = S3V_LIST_MAX_SEGMENTS,
+    workers: int = S3V_SCAN_WORKERS,
+    cursor: Cursor | None = None,
+    return_data: bool = False,
+    page_size: int = S3V_LIST_MAX_RESULTS,
+) -> Iterator[Page]:
+    """Yield every page of the index (vectors filtered by ``flt``), in arrival order.
+
+    A ``cursor`` from an earlier Page fixes the segment count and resumes
+    after that page; ``return_data=True`` includes the vectors themselves.
+    """
+    cursor = cursor or Cursor.start(segments)
+    ready = deque(i for i in range(cursor.segments) if not cursor.done[i])
+    inflight = {}
+    with ThreadPoolExecutor(min(workers, max(len(ready), 1))) as pool:
+
+        def top_up():
+            while ready and len(inflight) < workers:
+                seg = ready.popleft()
+                args = (seg, cursor.segments, cursor.tokens[seg], page_size)
+                future = pool.submit(
+                    _list_page, client, bucket, index, *args, return_data
+                )
+                inflight[future] = seg
+
+        top_up()
+        while inflight:
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for future in done:
+                seg = inflight.pop(future)
+                res = future.result()
+                cursor = cursor.advance(seg, res.get("nextToken"))
+                if not cursor.done[seg]:
+                    ready.append(seg)
+                top_up()  # keep the segment chains busy while the page is consumed
+                vectors = res.get("vectors", [])
+                scanned = len(vectors)
+                if flt is not None:
+                    keep = match_records(
+                        flt, [v.get("metadata") or {} for v in vectors]
+                    )
+                    vectors = [v for v, k in zip(vectors, keep.tolist()) if k]
+                yield Page(vectors, scanned, seg, cursor)
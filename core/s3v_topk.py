@@ -0,0 +1,59 @@
+"""Top-k beyond S3 Vectors' 100-result cap via partitioned fan-out.
+
+The index is split into disjoint metadata partitions (one per genre, or
+year buckets). Every partition is queried in parallel with ``topK <= 100``
+and the per-partition lists, each sorted by distance, are merged with a
+k-way heap. The merge is exact unless one partition holds more than 100 of
+the true top-k; such partitions come back full and are counted as
+``saturated``.
+"""
+
+import heapq
+import itertools
+import time
+
+from core.async_search import Hit
+from core.batch_search import s3v_batch_search
+from core.config import QUERY_CONCURRENCY, S3V_MAX_TOP_K
+from core.filters import Expr, field
+from core.metadata import MetadataTable
+
+
+def categorical_partitions(table: MetadataTable, name: str) -> list[Expr]:
+    """One partition per value of a categorical column, plus any other value."""
+    values = tuple(table.columns[name].values)
+    return [field(name) == v for v in values] + [field(name).notin(values)]
+
+
+def range_partitions(name: str, edges: list[float]) -> list[Expr]:
+    """Buckets ``< edges[0]``, ``[edges[i], edges[i + 1])``, ``>= edges[-1]``."""
+    f = field(name)
+    inner = [(f >= lo) & (f < hi) for lo, hi in itertools.pairwise(edges)]
+    return [f < edges[0], *inner, f >= edges[-1]]
+
+
+def s3v_query_top_k(
+    sc,
+    vec: list[float],
+    k: int,
+    partitions: list[Expr],
+    flt: Expr | None = None,
+    concurrency: int = QUERY_CONCURRENCY,
+) -> tuple[list[Hit], dict]:
+    """The ``k`` nearest hits over ``partitions`` (each ANDed with ``flt``).
+
+    Returns (hits, stats); stats has requests, saturated (partitions that
+    returned a full page and may have dropped true top-k hits) and ms.
+    """
+    page = min(k, S3V_MAX_TOP_K)
+    flts = [part & flt if flt else part for part in partitions]
+    t0 = time.perf_counter()
+    results = s3v_batch_search(sc, [vec] * len(flts), page, flts, concurrency)
+    merged = heapq.merge(*(r.hits for r in results), key=lambda h: h.score)
+    hits = list(itertools.islice(merged, k))
+    stats = {
+        "requests": len(flts),
+        "saturated": sum(len(r.hits) == page for r in results) if k > page else 0,
+        "ms": (time.perf_counter() - t0) * 1000,
+    }
+    return hits, stats
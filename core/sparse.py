@@ -0,0 +1,123 @@
+"""Deterministic sparse (keyword) vectors for Qdrant's sparse index.
+
+Token ids come from an append-only vocabulary persisted in CACHE_DIR, one
+token per line: an id never changes once assigned, so vectors encoded in
+different processes, or cached between runs, always agree. (Python's
+``hash`` is salted per process and cannot give that.)
+
+Document values are the BM25 term-frequency part,
+``tf * (k1 + 1) / (tf + k1 * (1 - b + b * len / SPARSE_AVG_DOC_LEN))``;
+query values are 1.0. The IDF factor is left to Qdrant: create the sparse
+vector with ``modifier=Modifier.IDF`` and the server applies live corpus
+statistics, so stored vectors never need re-encoding as the corpus grows.
+"""
+
+import fcntl
+import itertools
+import os
+from collections.abc import Iterable
+from contextlib import contextmanager
+
+import numpy as np
+
+from core.bm25 import tokenize
+from core.config import BM25_B, BM25_K1, CACHE_DIR, SPARSE_AVG_DOC_LEN
+
+SparseVector = tuple[list[int], list[float]]  # (indices, values)
+
+
+class Vocabulary:
+    """Append-only token → id map shared by every process using ``name``."""
+
+    def __init__(self, name: str = "sparse-vocab"):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        self.path = os.path.join(CACHE_DIR, f"{name}.txt")
+        self.lock_path = os.path.join(CACHE_DIR, f"{name}.lock")
+        self.ids: dict[str, int] = {}
+        self._read_bytes = 0
+        self.reload()
+
+    def reload(self) -> None:
+        """Pick up tokens appended by other processes."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self._read_bytes)
+            data = f.read()
+        # Only complete lines count; a torn final line is left for later.
+        data = data[: data.rfind(b"\n") + 1]
+        self._read_bytes += len(data)
+        for token in data.decode("utf-8").splitlines():
+            self.ids.setdefault(token, len(self.ids))
+
+    @contextmanager
+    def _locked(self):
+        with open(self.lock_path, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def lookup(self, tokens: Iterable[str]) -> np.ndarray:
+        """Ids of ``tokens``; -1 for tokens not in the vocabulary."""
+        get = self.ids.get
+        return np.fromiter((get(t, -1) for t in tokens), dtype=np.int64)
+
+    def add(self, tokens: Iterable[str]) -> np.ndarray:
+        """Ids of ``tokens``, assigning (and persisting) ids for new ones."""
+        tokens = list(tokens)
+        if any(t not in self.ids for t in tokens):
+            with self._locked():
+                self.reload()
+                fresh = list(dict.fromkeys(t for t in tokens if t not in self.ids))
+                if fresh:
+                    with open(self.path, "a", encoding="utf-8") as f:
+                        f.write("".join(f"{t}\n" for t in fresh))
+                    self.reload()
+        return self.lookup(tokens)
+
+
+class SparseEncoder:
+    """Texts → (indices, values) with stable ids; see the module docstring."""
+
+    def __init__(
+        self,
+        vocab: Vocabulary | None = None,
+        k1: float = BM25_K1,
+        b: float = BM25_B,
+        avg_doc_len: float = SPARSE_AVG_DOC_LEN,
+    ):
+        self.vocab = Vocabulary() if vocab is None else vocab
+        self.k1 = k1
+        self.b = b
+        self.avg_doc_len = avg_doc_len
+
+    def encode_documents(self, texts: list[str]) -> list[SparseVector]:
+        """One vector per text, indices ascending; new tokens join the vocabulary."""
+        tokens = [tokenize(t) for t in texts]
+        lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+        ids = self.vocab.add(itertools.chain.from_iterable(tokens))
+
+        stride = max(len(self.vocab), 1)
+        doc_of = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+        pairs, tf = np.unique(doc_of * stride + ids, return_counts=True)
+        doc, term = np.divmod(pairs, stride)
+        norm = self.k1 * (1 - self.b + self.b * lengths[doc] / self.avg_doc_len)
+        values = tf * (self.k1 + 1) / (tf + norm)
+
+        bounds = np.searchsorted(doc, np.arange(len(texts) + 1)).tolist()
+        indices, values = term.tolist(), values.tolist()
+        return [
+            (indices[lo:hi], values[lo:hi]) for lo, hi in itertools.pairwise(bounds)
+        ]
+
+    def encode_query(self, text: str) -> SparseVector:
+        """Known query tokens with weight 1.0; unknown tokens match nothing."""
+        self.vocab.reload()  # tokens other processes added since the last call
+        ids = np.unique(self.vocab.lookup(tokenize(text)))
+        ids = ids[ids >= 0].tolist()
+        return ids, [1.0] * len(ids)
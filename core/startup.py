@@ -0,0 +1,71 @@
+"""Import-time report — a per-entry-point summary of ``python -X importtime``."""
+
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from core.config import STARTUP_BUDGET_MS, STARTUP_BUDGET_OVERRIDES_MS
+
+ROOT = Path(__file__).resolve().parent.parent
+TOP_PACKAGES = 5  # heaviest top-level packages listed per entry point
+
+
+def measure_import(module: str) -> dict:
+    """Import ``module`` in a fresh interpreter and summarize where the time went.
+
+    Returns {"module", "total_ms", "packages": [(package, self_ms), ...], "error"},
+    with packages sorted by the self time of all their submodules combined.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    by_package: dict[str, float] = defaultdict(float)
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        by_package[name.strip().split(".")[0]] += int(self_us) / 1000
+
+    error = None
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()[-1]
+    return {
+        "module": module,
+        "total_ms": sum(by_package.values()),
+        "packages": sorted(by_package.items(), key=lambda kv: -kv[1]),
+        "error": error,
+    }
+
+
+def budget_for(module: str) -> float:
+    """Startup budget for an entry point: declared per module, never inferred
+    from what it imports, so a new heavy top-level import is always caught."""
+    return STARTUP_BUDGET_OVERRIDES_MS.get(module, STARTUP_BUDGET_MS)
+
+
+def import_report(modules: list[str]) -> tuple[list[str], bool]:
+    """Measure each module; return (report lines, all within budget)."""
+    lines = [
+        f"Import-time report (budget {STARTUP_BUDGET_MS}ms per entry point "
+        "unless declared in STARTUP_BUDGET_OVERRIDES_MS)",
+        f"{'Entry point':<36} {'Total':>8} {'Budget':>7}  Heaviest packages",
+        "-" * 100,
+    ]
+    within_budget = True
+    for module in modules:
+        r = measure_import(module)
+        budget_ms = budget_for(module)
+        over = r["total_ms"] > budget_ms
+        within_budget &= not over and r["error"] is None
+        top = ", ".join(f"{pkg} {ms:.0f}ms" for pkg, ms in r["packages"][:TOP_PACKAGES])
+        flag = " ✗ over budget" if over else ""
+        lines.append(
+            f"{module:<36} {r['total_ms']:>6.0f}ms {budget_ms:>5}ms  {top}{flag}"
+        )
+        if r["error"]:
+            lines.append(f"{'':<53}import failed: {r['error']}")
+    return lines, within_budget
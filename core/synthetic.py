@@ -0,0 +1,242 @@
+"""Deterministic synthetic movie corpus — the MOVIES schema at 10k…10M records.
+
+Records are generated lazily in fixed-size blocks, each from its own
+``(seed, block)`` RNG stream, so any slice of the corpus is reproducible
+without generating what comes before it and memory stays flat.
+
+Value distributions:
+    genre, language   MOVIES frequencies with add-one smoothing
+    year              recent-heavy (exponential decay back from 2024)
+    rating            IMDb-like normal(6.4, 1.1), clipped to 1.0–10.0
+    director          power law over a pool that grows with the corpus; the
+                      MOVIES directors are the most prolific names
+    description       genre-specific plot templates
+
+``pin`` controls filter selectivity exactly: ``pin={"genre": ("Western", 0.001)}``
+makes ``round(0.001 * n)`` records Westerns and no others. Each block takes
+its share of that count by cumulative rounding, so blocks stay independent.
+"""
+
+from collections import Counter
+from collections.abc import Callable, Iterator
+
+import numpy as np
+
+from core.dataset import MOVIES
+
+BLOCK_SIZE = 10_000  # part of the seed schedule — changing it changes the corpus
+ID_OFFSET = 1_000_000  # keeps qdrant_id() clear of the hand-written mov_NN ids
+LATEST_YEAR = 2024
+EARLIEST_YEAR = 1920
+
+
+def _smoothed(field: str) -> tuple[list[str], np.ndarray]:
+    counts = Counter(m[field] for m in MOVIES)
+    values = sorted(counts)
+    weights = np.array([counts[v] + 1 for v in values], dtype=np.float64)
+    return values, weights / weights.sum()
+
+
+GENRES, GENRE_P = _smoothed("genre")
+LANGUAGES, LANGUAGE_P = _smoothed("language")
+KNOWN_DIRECTORS = [d for d, _ in Counter(m["director"] for m in MOVIES).most_common()]
+
+FIRST_NAMES = [
+    "Ana", "Ben", "Chloe", "Dmitri", "Elena", "Farid", "Grace", "Hiro", "Ines",
+    "Jonas", "Kofi", "Lucia", "Mateo", "Nadia", "Omar", "Priya", "Quentin",
+    "Rosa", "Sven", "Tariq", "Uma", "Victor", "Wen", "Ximena", "Yusuf", "Zoe",
+]  # fmt: skip
+LAST_NAMES = [
+    "Abara", "Becker", "Castillo", "Dubois", "Eriksen", "Fischer", "Gupta",
+    "Haddad", "Ito", "Jensen", "Kowalski", "Laurent", "Moreau", "Nakamura",
+    "Okafor", "Petrov", "Quinn", "Rossi", "Silva", "Tanaka", "Ueda", "Varga",
+    "Weber", "Xu", "Yilmaz", "Zhou",
+]  # fmt: skip
+
+TITLE_ADJECTIVES = [
+    "Silent", "Broken", "Last", "Hidden", "Golden", "Crimson", "Distant",
+    "Endless", "Frozen", "Midnight", "Savage", "Electric", "Forgotten", "Hollow",
+]  # fmt: skip
+TITLE_NOUNS = [
+    "Horizon", "Empire", "River", "Signal", "Garden", "Harbor", "Protocol",
+    "Kingdom", "Machine", "Witness", "Frontier", "Symphony", "Labyrinth", "Storm",
+]  # fmt: skip
+SEQUELS = ["", "", "", "", " II", " III", ": Reckoning", ": Origins"]
+
+SUBJECTS = [
+    "A reluctant hero", "An estranged sister", "A retired detective",
+    "A young engineer", "An ambitious journalist", "A small-town teacher",
+    "A disgraced soldier", "A brilliant but isolated scientist",
+]  # fmt: skip
+SETTINGS = [
+    "in a city on the brink of collapse", "across a frozen wasteland",
+    "in a quiet coastal village", "aboard a failing starship",
+    "during a long hot summer", "in the shadow of a dying empire",
+]  # fmt: skip
+PLOTS = {
+    "Action": [
+        "fights through a private army to rescue a kidnapped ally",
+        "races to stop a stolen warhead before it reaches the coast",
+        "leads a last stand against an invading mercenary force",
+    ],
+    "Animation": [
+        "befriends a talking creature on a magical journey home",
+        "joins a band of toys searching for their lost owner",
+        "learns to fly with a flock of misfit birds",
+    ],
+    "Comedy": [
+        "fakes a wedding that spirals into glorious chaos",
+        "swaps lives with a rival for one disastrous week",
+        "inherits a failing circus and a very stubborn llama",
+    ],
+    "Crime": [
+        "plans one final heist against a ruthless crime family",
+        "goes undercover inside a cartel to expose a corrupt cop",
+        "launders money for the mob until the books stop balancing",
+    ],
+    "Drama": [
+        "confronts a painful past while holding a family together",
+        "fights a powerful company in a court case nobody expects to win",
+        "cares for a dying parent and rediscovers a lost vocation",
+    ],
+    "Fantasy": [
+        "must destroy an ancient relic before dark forces claim it",
+        "is crowned ruler of a hidden kingdom of dragons",
+        "bargains with a trickster god to break a family curse",
+    ],
+    "Horror": [
+        "is stalked by an unseen presence that feeds on fear",
+        "moves into a house whose previous owners never left",
+        "wakes a buried evil while filming a documentary",
+    ],
+    "Romance": [
+        "falls in love with a stranger who is leaving forever",
+        "writes letters to a pen pal who turns out to be a rival",
+        "reunites with a first love at a disastrous reunion",
+    ],
+    "Sci-Fi": [
+        "discovers a signal from deep space that rewrites history",
+        "travels through a wormhole to save a dying colony",
+        "builds an artificial mind that begins to dream",
+    ],
+    "Thriller": [
+        "uncovers a conspiracy that reaches the highest offices",
+        "is framed for a murder and has one night to prove innocence",
+        "tracks a serial killer who leaves clues in old films",
+    ],
+    "Western": [
+        "rides into a lawless frontier town to settle an old debt",
+        "guards a gold shipment across hostile desert territory",
+        "hunts the outlaw gang that burned down the family ranch",
+    ],
+}
+
+
+def _director_name(rank: int) -> str:
+    if rank < len(KNOWN_DIRECTORS):
+        return KNOWN_DIRECTORS[rank]
+    i = rank - len(KNOWN_DIRECTORS)
+    first = FIRST_NAMES[i % len(FIRST_NAMES)]
+    last = LAST_NAMES[(i // len(FIRST_NAMES)) % len(LAST_NAMES)]
+    suffix = i // (len(FIRST_NAMES) * len(LAST_NAMES))
+    return f"{first} {last}" + (f" {suffix + 1}" if suffix else "")
+
+
+def _samplers(n_total: int) -> dict[str, Callable[[np.random.Generator, int], list]]:
+    """Per-field samplers; each draws ``k`` values from the base distribution."""
+    pool = max(len(KNOWN_DIRECTORS), n_total // 10)
+
+    def genre(rng, k):
+        return [GENRES[i] for i in rng.choice(len(GENRES), k, p=GENRE_P)]
+
+    def language(rng, k):
+        return [LANGUAGES[i] for i in rng.choice(len(LANGUAGES), k, p=LANGUAGE_P)]
+
+    def year(rng, k):
+        back = np.floor(rng.exponential(15.0, k)).astype(int)
+        return np.maximum(LATEST_YEAR - back, EARLIEST_YEAR).tolist()
+
+    def rating(rng, k):
+        return np.round(np.clip(rng.normal(6.4, 1.1, k), 1.0, 10.0), 1).tolist()
+
+    def director(rng, k):
+        ranks = np.floor(pool * rng.random(k) ** 2).astype(int)
+        return [_director_name(int(r)) for r in ranks]
+
+    return {
+        "genre": genre,
+        "year": year,
+        "rating": rating,
+        "director": director,
+        "language": language,
+    }
+
+
+def _apply_pin(rng, values: list, sample, value, count: int) -> list:
+    """Set exactly ``count`` random positions of ``values`` to ``value``, no others."""
+    hit = np.zeros(len(values), dtype=bool)
+    hit[rng.choice(len(values), count, replace=False)] = True
+    values = [value if h else v for v, h in zip(values, hit)]
+    redraw = [i for i, (v, h) in enumerate(zip(values, hit)) if v == value and not h]
+    while redraw:
+        for i, v in zip(redraw, sample(rng, len(redraw))):
+            values[i] = v
+        redraw = [i for i in redraw if values[i] == value]
+    return values
+
+
+def _block(
+    seed: int, block: int, n_total: int, pin: dict[str, tuple] | None
+) -> list[dict]:
+    rng = np.random.default_rng([seed, block])
+    lo = block * BLOCK_SIZE
+    k = min(BLOCK_SIZE, n_total - lo)
+    samplers = _samplers(n_total)
+    fields = {name: sample(rng, k) for name, sample in samplers.items()}
+    for name, (value, fraction) in (pin or {}).items():
+        count = round(fraction * (lo + k)) - round(fraction * lo)
+        fields[name] = _apply_pin(rng, fields[name], samplers[name], value, count)
+
+    adj = rng.integers(len(TITLE_ADJECTIVES), size=k)
+    noun = rng.integers(len(TITLE_NOUNS), size=k)
+    sequel = rng.integers(len(SEQUELS), size=k)
+    subj = rng.integers(len(SUBJECTS), size=k)
+    name = rng.integers(len(FIRST_NAMES), size=k)
+    plot = rng.integers(len(PLOTS["Drama"]), size=k)
+    setting = rng.integers(len(SETTINGS), size=k)
+
+    records = []
+    for j in range(k):
+        genre = fields["genre"][j]
+        records.append(
+            {
+                "id": f"syn_{ID_OFFSET + lo + j}",
+                "title": (
+                    f"The {TITLE_ADJECTIVES[adj[j]]} {TITLE_NOUNS[noun[j]]}"
+                    f"{SEQUELS[sequel[j]]}"
+                ),
+                "description": (
+                    f"{SUBJECTS[subj[j]]} named {FIRST_NAMES[name[j]]} "
+                    f"{PLOTS[genre][plot[j]]} {SETTINGS[setting[j]]}."
+                ),
+                "genre": genre,
+                "year": fields["year"][j],
+                "rating": fields["rating"][j],
+                "director": fields["director"][j],
+                "language": fields["language"][j],
+            }
+        )
+    return records
+
+
+def generate_movies(
+    n: int, seed: int = 0, start: int = 0, pin: dict[str, tuple] | None = None
+) -> Iterator[dict]:
+    """Yield records ``start`` … ``n - 1`` of the ``n``-record corpus for ``seed``.
+
+    The same (n, seed, pin) always yields the same records, whatever ``start``.
+    """
+    for block in range(start // BLOCK_SIZE, -(-n // BLOCK_SIZE)):
+        records = _block(seed, block, n, pin)
+        skip = max(0, start - block * BLOCK_SIZE)
+        yield from records[skip:]
@@ -0,0 +1,226 @@
+"""Append-only, memory-mapped float32 vector store keyed by content hash.
+
+Four ``.npy`` files live side by side in CACHE_DIR:
+
+    <name>.npy        float32 matrix, one row per vector
+    <name>.keys.npy   fixed-width hex keys, row-aligned with the matrix
+    <name>.skeys.npy  keys of the first m rows, sorted
+    <name>.srows.npy  int64 row of each sorted key
+
+Rows are only ever appended. Vectors are written before keys, and readers trust
+``min(len(keys), len(rows))``, so an interrupted append is simply invisible.
+
+Lookups binary-search the memory-mapped sorted index; rows appended since it
+was last merged (at most ``max(INDEX_TAIL_ROWS, m // 16)``) are sorted in
+memory on reload. Opening a store therefore never decodes every key, and the
+index is merged geometrically, so appends stay amortized O(log n) per row.
+"""
+
+import fcntl
+import os
+from collections.abc import Iterable
+from contextlib import contextmanager
+
+import numpy as np
+
+from core.config import CACHE_DIR
+
+KEY_DTYPE = np.dtype("S32")  # 128-bit digest as hex
+INDEX_TAIL_ROWS = 4096  # unindexed rows tolerated before merging into the index
+
+
+def _read_header(f) -> tuple[tuple[int, ...], np.dtype, int]:
+    """Return (shape, dtype, header_length) of an open .npy file."""
+    f.seek(0)
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        shape, _, dtype = np.lib.format.read_array_header_1_0(f)
+    else:
+        shape, _, dtype = np.lib.format.read_array_header_2_0(f)
+    return shape, dtype, f.tell()
+
+
+def _write_shape(f, dtype: np.dtype, shape: tuple[int, ...]) -> None:
+    """Rewrite the header of an open .npy file with a new shape."""
+    f.seek(0)
+    np.lib.format.write_array_header_1_0(
+        f,
+        {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": shape,
+        },
+    )
+
+
+def _append_npy(path: str, rows: np.ndarray) -> None:
+    """Append ``rows`` along axis 0 of the .npy file at ``path`` (creating it).
+
+    numpy pads every header with room for a 64-bit length on the growth axis,
+    so the shape can be rewritten in place without moving the data.
+    """
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            np.save(f, rows)
+        return
+
+    with open(path, "r+b") as f:
+        shape, dtype, header_len = _read_header(f)
+        if dtype != rows.dtype or shape[1:] != rows.shape[1:]:
+            raise ValueError(
+                f"{path}: cannot append {rows.dtype}{rows.shape[1:]} "
+                f"to {dtype}{shape[1:]}"
+            )
+        f.seek(header_len + shape[0] * dtype.itemsize * int(np.prod(shape[1:])))
+        f.write(rows.tobytes())
+        f.truncate()
+        _write_shape(f, dtype, (shape[0] + len(rows), *shape[1:]))
+
+
+def _save_atomic(path: str, array: np.ndarray) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+
+
+def _find(sorted_keys: np.ndarray, rows: np.ndarray, query: np.ndarray, out) -> None:
+    """Fill ``out`` with the row of each ``query`` key found in ``sorted_keys``."""
+    if not len(sorted_keys):
+        return
+    pos = np.searchsorted(sorted_keys, query).clip(max=len(sorted_keys) - 1)
+    hit = sorted_keys[pos] == query
+    out[hit] = rows[pos[hit]]
+
+
+class VectorStore:
+    """Content-addressed embedding rows backed by a memory-mapped matrix."""
+
+    def __init__(self, name: str, dim: int):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        self.name = name
+        self.dim = dim
+        self.path = os.path.join(CACHE_DIR, f"{name}.npy")
+        self.keys_path = os.path.join(CACHE_DIR, f"{name}.keys.npy")
+        self.skeys_path = os.path.join(CACHE_DIR, f"{name}.skeys.npy")
+        self.srows_path = os.path.join(CACHE_DIR, f"{name}.srows.npy")
+        self.lock_path = os.path.join(CACHE_DIR, f"{name}.lock")
+        self.matrix = np.zeros((0, dim), dtype=np.float32)
+        self._keys = np.zeros(0, dtype=KEY_DTYPE)
+        self._sorted = (np.zeros(0, dtype=KEY_DTYPE), np.zeros(0, dtype=np.int64))
+        self._tail = self._sorted
+        self.reload()
+        if self._tail_too_long():  # e.g. a store written before the index existed
+            with self._locked():
+                self.reload()
+                self._merge_index()
+
+    def _load_index(self) -> tuple[np.ndarray, np.ndarray]:
+        # Writers replace skeys before srows, so equal lengths mean one generation.
+        for _ in range(3):
+            try:
+                srows = np.load(self.srows_path, mmap_mode="r")
+                skeys = np.load(self.skeys_path, mmap_mode="r")
+            except FileNotFoundError:
+                break
+            if len(skeys) == len(srows):
+                return skeys, srows
+        return np.zeros(0, dtype=KEY_DTYPE), np.zeros(0, dtype=np.int64)
+
+    def reload(self) -> None:
+        """Re-open the files, picking up rows appended by other processes."""
+        if not (os.path.exists(self.path) and os.path.exists(self.keys_path)):
+            return
+        matrix = np.load(self.path, mmap_mode="r")
+        if matrix.shape[1] != self.dim:
+            raise ValueError(
+                f"{self.path} holds {matrix.shape[1]}-d vectors, expected {self.dim}"
+            )
+        keys = np.load(self.keys_path, mmap_mode="r")
+        n = min(len(keys), len(matrix))
+        skeys, srows = self._load_index()
+        if len(skeys) > n:  # index of a store that has since been replaced
+            skeys, srows = skeys[:0], srows[:0]
+        tail_keys = np.asarray(keys[len(skeys) : n])
+        order = np.argsort(tail_keys, kind="stable")
+        self._sorted = (skeys, srows)
+        self._tail = (tail_keys[order], order + len(skeys))
+        self._keys = keys[:n]
+        self.matrix = matrix[:n]
+
+    def _tail_too_long(self) -> bool:
+        return len(self._tail[0]) > max(INDEX_TAIL_ROWS, len(self._sorted[0]) // 16)
+
+    def _merge_index(self) -> None:
+        """Fold the tail into the persisted sorted index (caller holds the lock)."""
+        skeys, srows = self._sorted
+        tail_keys, tail_rows = self._tail
+        if not len(tail_keys):
+            return
+        pos = np.searchsorted(skeys, tail_keys)
+        _save_atomic(self.skeys_path, np.insert(skeys, pos, tail_keys))
+        _save_atomic(self.srows_path, np.insert(srows, pos, tail_rows))
+        self.reload()
+
+    @contextmanager
+    def _locked(self):
+        with open(self.lock_path, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def rows(self, keys: Iterable[str]) -> np.ndarray:
+        """Row of each key in ``keys``; -1 for keys not stored."""
+        query = np.asarray(list(keys), dtype=KEY_DTYPE)
+        out = np.full(len(query), -1, dtype=np.int64)
+        _find(*self._sorted, query, out)
+        _find(*self._tail, query, out)
+        return out
+
+    def __contains__(self, key: str) -> bool:
+        return self.rows([key])[0] >= 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get(self, key: str) -> np.ndarray | None:
+        row = self.rows([key])[0]
+        return None if row < 0 else self.matrix[row]
+
+    def append(self, keys: list[str], vectors: np.ndarray) -> None:
+        """Persist new (key, vector) pairs; keys already stored are skipped."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        if len(keys) != len(vectors):
+            raise ValueError(f"{len(keys)} keys for {len(vectors)} vectors")
+
+        with self._locked():
+            self.reload()
+            fresh = {}
+            for i, (k, row) in enumerate(zip(keys, self.rows(keys).tolist())):
+                if row < 0 and k not in fresh:
+                    fresh[k] = i
+            if not fresh:
+                return
+            rows = list(fresh.values())
+            # Drop any torn tail left by an interrupted writer before appending.
+            self._truncate_to(len(self))
+            _append_npy(self.path, np.ascontiguousarray(vectors[rows]))
+            _append_npy(self.keys_path, np.array(list(fresh), dtype=KEY_DTYPE))
+            self.reload()
+            if self._tail_too_long():
+                self._merge_index()
+
+    def _truncate_to(self, n: int) -> None:
+        for path, row_bytes in (
+            (self.path, self.dim * 4),
+            (self.keys_path, KEY_DTYPE.itemsize),
+        ):
+            if not os.path.exists(path):
+                continue
+            with open(path, "r+b") as f:
+                shape, dtype, header_len = _read_header(f)
+                if shape[0] != n:
+                    _write_shape(f, dtype, (n, *shape[1:]))
+                    f.truncate(header_len + n * row_bytes)
@@ -5,8 +5,10 @@ Captures every test's output and writes it to a single report file.
 
 Usage:
     python run_all.py
+    python run_all.py --import-report   # startup cost per test module, then exit
 """
 
+import argparse
 import importlib
 import io
 import sys
@@ -86,6 +88,23 @@ def build_report(results: list[tuple[int, str, str, bool]]) -> str:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Run all 25 comparison tests")
+    parser.add_argument(
+        "--import-report",
+        action="store_true",
+        help="Report import time per entry point against the startup budget and exit.",
+    )
+    args = parser.parse_args()
+
+    if args.import_report:
+        from core.startup import import_report
+
+        modules = ["setup", "core.embeddings", "core.clients"]
+        modules += [f"tests.{name}" for _, name in TESTS]
+        lines, within_budget = import_report(modules)
+        print("\n".join(lines))
+        sys.exit(0 if within_budget else 1)
+
     print("Running all 25 tests...\n")
 
     results = []
@@ -104,6 +123,15 @@ def main():
     print(f"\nDone. {passed} passed, {failed} failed.")
     print(f"Report saved to: {REPORT_PATH}")
 
+    from core.embeddings import query_cache_stats
+
+    stats = query_cache_stats()
+    print(
+        f"Query embedding cache: {stats['memory_hits']} memory hits, "
+        f"{stats['disk_hits']} disk hits, {stats['misses']} misses "
+        f"({stats['disk_entries']} queries on disk)"
+    )
+
 
 if __name__ == "__main__":
     main()
@@ -4,27 +4,34 @@ import time
 
 from dotenv import load_dotenv
 
+from core.clients import get_qdrant
 from core.config import (
     AWS_REGION,
     EMBEDDING_DIM,
     QDRANT_COLLECTION,
-    QDRANT_URL,
     S3V_BUCKET_NAME,
     S3V_INDEX_NAME,
-    qdrant_id,
 )
 from core.dataset import MOVIES
 from core.embeddings import generate_movie_embeddings
+from core.pipeline import ingest
+from core.sync import sync
 
 # ── Qdrant setup ──────────────────────────────────────────────
 load_dotenv()
 
 
-def setup_qdrant():
-    from qdrant_client import QdrantClient, models
+def create_qdrant_collection(recreate: bool = True):
+    """Create the collection with payload indexes; returns the client.
+
+    With ``recreate=False`` an existing collection is kept as it is.
+    """
+    from qdrant_client import models
 
-    client = QdrantClient(url=QDRANT_URL, timeout=120)
+    client = get_qdrant()
     if client.collection_exists(collection_name=QDRANT_COLLECTION):
+        if not recreate:
+            return client
         client.delete_collection(collection_name=QDRANT_COLLECTION)
 
     client.create_collection(
@@ -41,33 +48,22 @@ def setup_qdrant():
         client.create_payload_index(
             QDRANT_COLLECTION, f, models.PayloadSchemaType.FLOAT
         )
+    return client
 
-    embeddings = generate_movie_embeddings(MOVIES)
-    points = [
-        models.PointStruct(
-            id=qdrant_id(m["id"]),
-            vector=embeddings[m["id"]],
-            payload={
-                k: m[k]
-                for k in [
-                    "title",
-                    "description",
-                    "genre",
-                    "year",
-                    "rating",
-                    "director",
-                    "language",
-                ]
-            },
-        )
-        for m in MOVIES
-    ]
-    client.upsert(QDRANT_COLLECTION, points)
-    print(f"  Qdrant: {len(points)} movies loaded")
-    return client, embeddings
 
+def setup_qdrant():
+    client = create_qdrant_collection()
+    stats = ingest(MOVIES, qdrant=client)["qdrant"]
+    print(
+        f"  Qdrant: {stats['points']} movies loaded "
+        f"({stats['points_per_sec']:.0f} points/sec, "
+        f"searchable after {stats['searchable_seconds']:.1f}s more)"
+    )
+    return client, generate_movie_embeddings(MOVIES)
 
-def setup_s3vectors():
+
+def create_s3v_index():
+    """Create the vector bucket and index if missing; returns the client."""
     import boto3
 
     client = boto3.client("s3vectors", region_name=AWS_REGION)
@@ -87,40 +83,48 @@ def setup_s3vectors():
         )
     except client.exceptions.ConflictException:
         pass
+    return client
+
 
-    embeddings = generate_movie_embeddings(MOVIES)
-    vectors = [
-        {
-            "key": m["id"],
-            "data": {"float32": embeddings[m["id"]]},
-            "metadata": {
-                k: m[k]
-                for k in [
-                    "title",
-                    "description",
-                    "genre",
-                    "year",
-                    "rating",
-                    "director",
-                    "language",
-                ]
-            },
-        }
-        for m in MOVIES
-    ]
-    client.put_vectors(
-        vectorBucketName=S3V_BUCKET_NAME, indexName=S3V_INDEX_NAME, vectors=vectors
+def setup_s3vectors():
+    client = create_s3v_index()
+    stats = ingest(MOVIES, s3v=client)["s3vectors"]
+    print(
+        f"  S3 Vectors: {stats['vectors']} movies loaded in {stats['calls']} calls "
+        f"({stats['vectors_per_sec']:.0f} vectors/sec, {stats['retries']} throttled retries)"
     )
-    print(f"  S3 Vectors: {len(vectors)} movies loaded")
-    return client, embeddings
+    return client, generate_movie_embeddings(MOVIES)
 
 
-def setup_both():
-    """Returns (qdrant_client, s3v_client, embeddings)."""
+def setup_both(reload: bool = False):
+    """Returns (qdrant_client, s3v_client, embeddings).
+
+    By default existing data is synced (only new/changed records are
+    uploaded, removed ones deleted); ``reload=True`` drops and reloads all.
+    """
     print("Setting up both platforms...")
-    qc, emb = setup_qdrant()
-    sc, _ = setup_s3vectors()
-    time.sleep(2)  # let S3 Vectors index settle (eventual consistency)
+    qc, sc = create_qdrant_collection(recreate=reload), create_s3v_index()
+    if reload:
+        # Encode and upload overlap; both backends load from the same batches.
+        stats = ingest(MOVIES, qdrant=qc, s3v=sc)
+        print(
+            f"  Ingested {stats['records']} movies in {stats['seconds']:.1f}s "
+            f"(encode {stats['encode_seconds']:.1f}s, "
+            f"Qdrant {stats['qdrant']['seconds']:.1f}s, "
+            f"S3 Vectors {stats['s3vectors']['seconds']:.1f}s)"
+        )
+    else:
+        stats = sync(MOVIES, qdrant=qc, s3v=sc)
+        for name, label in (("qdrant", "Qdrant"), ("s3vectors", "S3 Vectors")):
+            c = stats[name]
+            print(
+                f"  {label}: {c['unchanged']} unchanged, {c['changed']} upserted, "
+                f"{c['deleted']} deleted"
+            )
+        print(f"  Synced {stats['records']} movies in {stats['seconds']:.1f}s")
+    emb = generate_movie_embeddings(MOVIES)  # all cached by now
+    if reload or stats["upserted"]:
+        time.sleep(2)  # let S3 Vectors index settle (eventual consistency)
     print("  Ready.\n")
     return qc, sc, emb
 
@@ -129,9 +133,7 @@ def setup_both():
 
 
 def cleanup_qdrant():
-    from qdrant_client import QdrantClient
-
-    QdrantClient(url=QDRANT_URL).delete_collection(QDRANT_COLLECTION)
+    get_qdrant().delete_collection(QDRANT_COLLECTION)
     print("Qdrant cleaned up.")
 
 
@@ -3,11 +3,9 @@ Test 01: Semantic Search (top-K cosine) — Qdrant vs S3 Vectors
 """
 
 import time
-from typing import List, Tuple
 
-from core.clients import get_clients
-from core.config import QDRANT_COLLECTION, S3V_BUCKET_NAME, S3V_INDEX_NAME
-from core.embeddings import generate_query_embedding
+from core.async_search import DualSearch
+from core.embeddings import generate_query_embeddings
 
 TOP_K = 5
 
@@ -18,48 +16,6 @@ QUERIES = [
 ]
 
 
-def search_qdrant(
-    client, query_vector: List[float]
-) -> Tuple[List[Tuple[str, float]], float]:
-    start = time.perf_counter()
-
-    response = client.query_points(
-        collection_name=QDRANT_COLLECTION,
-        query=query_vector,
-        limit=TOP_K,
-        with_payload=True,
-    )
-
-    duration_ms = (time.perf_counter() - start) * 1000
-
-    hits = [(point.payload["title"], point.score) for point in response.points]
-    return hits, duration_ms
-
-
-def search_s3_vectors(
-    client, query_vector: List[float]
-) -> Tuple[List[Tuple[str, float]], float]:
-    start = time.perf_counter()
-
-    response = client.query_vectors(
-        vectorBucketName=S3V_BUCKET_NAME,
-        indexName=S3V_INDEX_NAME,
-        queryVector={"float32": query_vector},
-        topK=TOP_K,
-        returnDistance=True,
-        returnMetadata=True,
-    )
-
-    duration_ms = (time.perf_counter() - start) * 1000
-
-    hits = [
-        (vector["metadata"]["title"], vector["distance"])
-        for vector in response["vectors"]
-    ]
-
-    return hits, duration_ms
-
-
 def print_header(query: str) -> None:
     print(f'\nQuery: "{query}"')
     print(f"{'#':<3} {'Qdrant':<35} {'Score':<8} {'S3 Vectors':<35} {'Score':<8}")
@@ -82,21 +38,38 @@ def print_results(q_hits, s_hits, q_ms, s_ms) -> None:
 
 #
 def run() -> None:
-    qdrant_client, s3Vector_client = get_clients()
-
     print("=" * 60)
     print("TEST 01: Semantic Search (top-K, cosine similarity)")
     print("=" * 60)
 
-    for query in QUERIES:
-        query_vector = generate_query_embedding(query)
-
+    vectors = generate_query_embeddings(QUERIES).tolist()
+
+    with DualSearch() as search:
+        # Per-query latencies: one call at a time, so each is the backend alone.
+        results = [
+            (
+                search.run(search.qdrant_search(vec, TOP_K)),
+                search.run(search.s3v_search(vec, TOP_K)),
+            )
+            for vec in vectors
+        ]
+        # Then every query on both backends at once, timed as a whole.
+        t0 = time.perf_counter()
+        search.run(search.compare(vectors, TOP_K))
+        wall_ms = (time.perf_counter() - t0) * 1000
+
+    for query, (q_res, s_res) in zip(QUERIES, results):
         print_header(query)
-
-        q_hits, q_time = search_qdrant(qdrant_client, query_vector)
-        s_hits, s_time = search_s3_vectors(s3Vector_client, query_vector)
-
-        print_results(q_hits, s_hits, q_time, s_time)
+        print_results(
+            [(h.payload["title"], h.score) for h in q_res.hits],
+            [(h.payload["title"], h.score) for h in s_res.hits],
+            q_res.ms,
+            s_res.ms,
+        )
+
+    serial_ms = sum(q.ms + s.ms for q, s in results)
+    print(f"\n→ {len(QUERIES)} queries x 2 backends one at a time: {serial_ms:.0f}ms")
+    print(f"→ Same queries all in flight concurrently: {wall_ms:.0f}ms wall time")
 
 
 if __name__ == "__main__":
@@ -2,18 +2,18 @@
 
 import time
 
-from qdrant_client import models
-
 from core.clients import get_clients
 from core.config import QDRANT_COLLECTION, S3V_BUCKET_NAME, S3V_INDEX_NAME
+from core.dataset import FILTERS
 from core.embeddings import generate_query_embedding
+from core.filters import to_qdrant, to_s3v
 
 
 def run():
     qc, sc = get_clients()
+    flt = FILTERS["f2"]
     qvec = generate_query_embedding("great modern movies")
 
-
     # Qdrant
     t0 = time.perf_counter()
     q_res = qc.query_points(
@@ -21,9 +21,7 @@ def run():
         query=qvec,
         limit=5,
         with_payload=True,
-        query_filter=models.Filter(
-            must=[models.FieldCondition(key="year", range=models.Range(gte=2010))]
-        ),
+        query_filter=to_qdrant(flt),
     )
     q_ms = (time.perf_counter() - t0) * 1000
 
@@ -34,7 +32,7 @@ def run():
         indexName=S3V_INDEX_NAME,
         queryVector={"float32": qvec},
         topK=6,
-        filter={"year": {"$gte": 2010}},
+        filter=to_s3v(flt),
         returnDistance=True,
         returnMetadata=True,
     )
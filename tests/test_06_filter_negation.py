@@ -2,15 +2,16 @@
 
 import time
 
-from qdrant_client import models
-
 from core.clients import get_clients
 from core.config import QDRANT_COLLECTION, S3V_BUCKET_NAME, S3V_INDEX_NAME
+from core.dataset import FILTERS
 from core.embeddings import generate_query_embedding
+from core.filters import to_qdrant, to_s3v
 
 
 def run():
     qc, sc = get_clients()
+    flt = FILTERS["f6"]
     qvec = generate_query_embedding("great international films")
 
     print("=" * 60)
@@ -24,13 +25,7 @@ def run():
         query=qvec,
         limit=5,
         with_payload=True,
-        query_filter=models.Filter(
-            must_not=[
-                models.FieldCondition(
-                    key="language", match=models.MatchValue(value="English")
-                ),
-            ]
-        ),
+        query_filter=to_qdrant(flt),
     )
     q_ms = (time.perf_counter() - t0) * 1000
 
@@ -41,7 +36,7 @@ def run():
         indexName=S3V_INDEX_NAME,
         queryVector={"float32": qvec},
         topK=5,
-        filter={"language": {"$ne": "English"}},
+        filter=to_s3v(flt),
         returnDistance=True,
         returnMetadata=True,
     )
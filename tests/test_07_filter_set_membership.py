@@ -2,38 +2,30 @@
 
 import time
 
-from qdrant_client import models
-
 from core.clients import get_clients
 from core.config import QDRANT_COLLECTION, S3V_BUCKET_NAME, S3V_INDEX_NAME
+from core.dataset import FILTERS
 from core.embeddings import generate_query_embedding
+from core.filters import to_qdrant, to_s3v
 
 
 def run():
     qc, sc = get_clients()
+    flt = FILTERS["f7"]
     qvec = generate_query_embedding("exciting intense movies")
 
     print("=" * 60)
     print("TEST 07: Filter — Set Membership (genre IN [Action, Thriller])")
     print("=" * 60)
 
-    # Qdrant: should with multiple match conditions
+    # Qdrant: MatchAny
     t0 = time.perf_counter()
     q_res = qc.query_points(
         QDRANT_COLLECTION,
         query=qvec,
         limit=5,
         with_payload=True,
-        query_filter=models.Filter(
-            should=[
-                models.FieldCondition(
-                    key="genre", match=models.MatchValue(value="Action")
-                ),
-                models.FieldCondition(
-                    key="genre", match=models.MatchValue(value="Thriller")
-                ),
-            ]
-        ),
+        query_filter=to_qdrant(flt),
     )
     q_ms = (time.perf_counter() - t0) * 1000
 
@@ -44,7 +36,7 @@ def run():
         indexName=S3V_INDEX_NAME,
         queryVector={"float32": qvec},
         topK=5,
-        filter={"genre": {"$in": ["Action", "Thriller"]}},
+        filter=to_s3v(flt),
         returnDistance=True,
         returnMetadata=True,
     )
@@ -2,22 +2,23 @@
 
 import time
 
-from qdrant_client import QdrantClient, models
-
+from core.clients import get_qdrant
 from core.config import (
     AWS_REGION,
     EMBEDDING_DIM,
     QDRANT_COLLECTION,
-    QDRANT_URL,
     S3V_BUCKET_NAME,
     S3V_INDEX_NAME,
     qdrant_id,
 )
 from core.dataset import MOVIES
 from core.embeddings import generate_movie_embeddings
+from core.qdrant_loader import bulk_upload
 
 
 def run():
+    from qdrant_client import models
+
     embeddings = generate_movie_embeddings(MOVIES)
 
     print("=" * 60)
@@ -25,7 +26,7 @@ def run():
     print("=" * 60)
 
     # ── Qdrant ────────────────────────────────────────────────
-    qc = QdrantClient(url=QDRANT_URL)
+    qc = get_qdrant()
     qc.recreate_collection(
         QDRANT_COLLECTION,
         vectors_config=models.VectorParams(
@@ -36,7 +37,7 @@ def run():
     points = [
         models.PointStruct(
             id=qdrant_id(m["id"]),
-            vector=embeddings[m["id"]],
+            vector=embeddings[m["id"]].tolist(),
             payload={
                 k: m[k]
                 for k in ["title", "genre", "year", "rating", "director", "language"]
@@ -45,12 +46,15 @@ def run():
         for m in MOVIES
     ]
 
-    t0 = time.perf_counter()
-    qc.upsert(QDRANT_COLLECTION, points)
-    q_ms = (time.perf_counter() - t0) * 1000
+    stats = bulk_upload(qc, points)
+    q_ms = stats["upload_seconds"] * 1000
 
-    print(f"\nQdrant: Inserted {len(points)} vectors in {q_ms:.0f}ms")
-    print(f"  Method: upsert() — no hard batch limit")
+    print(f"\nQdrant: Inserted {stats['points']} vectors in {q_ms:.0f}ms")
+    print(
+        f"  {stats['points_per_sec']:.0f} points/sec, searchable "
+        f"{stats['searchable_seconds'] * 1000:.0f}ms after upload"
+    )
+    print(f"  Method: upload_points() — parallel batches, indexing deferred")
     print(f"  Supports: upsert (insert or update), flexible batch size")
 
     # ── S3 Vectors ────────────────────────────────────────────
@@ -74,7 +78,7 @@ def run():
     vectors = [
         {
             "key": m["id"],
-            "data": {"float32": embeddings[m["id"]]},
+            "data": {"float32": embeddings[m["id"]].tolist()},
             "metadata": {
                 k: m[k]
                 for k in ["title", "genre", "year", "rating", "director", "language"]
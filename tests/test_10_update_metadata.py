@@ -57,7 +57,7 @@ def run():
         vectors=[
             {
                 "key": target_id,
-                "data": {"float32": embeddings[target_id]},
+                "data": {"float32": embeddings[target_id].tolist()},
                 "metadata": full_metadata,
             }
         ],
@@ -2,13 +2,13 @@
 
 import time
 
-from qdrant_client import models
-
 from core.clients import get_clients
 from core.config import QDRANT_COLLECTION, S3V_BUCKET_NAME, S3V_INDEX_NAME, qdrant_id
 
 
 def run():
+    from qdrant_client import models
+
     qc, sc = get_clients()
 
     print("=" * 60)
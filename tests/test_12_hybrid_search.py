@@ -1,91 +1,67 @@
-"""Test 12: Hybrid Search (dense + sparse) — Qdrant only."""
+"""Test 12: Hybrid Search (dense + sparse) — Qdrant native, S3 via local BM25."""
 
-import time
-
-from qdrant_client import QdrantClient, models
-
-from core.config import EMBEDDING_DIM, QDRANT_URL, qdrant_id
+from core.clients import get_qdrant, get_s3v
 from core.dataset import MOVIES
 from core.embeddings import generate_movie_embeddings, generate_query_embedding
+from core.hybrid import (
+    create_qdrant_hybrid_collection,
+    movie_index,
+    qdrant_hybrid_search,
+    s3v_hybrid_search,
+)
+from core.sparse import SparseEncoder
 
 COLLECTION = "movies_hybrid"  # Separate collection — don't touch shared 'movies'
+PREFETCH_LIMIT = 10
+LIMIT = 5
 
 
 def run():
     print("=" * 60)
-    print("TEST 12: Hybrid Search (dense + sparse vectors) — Qdrant only")
+    print("TEST 12: Hybrid Search (dense + sparse vectors)")
     print("=" * 60)
 
-    qc = QdrantClient(url=QDRANT_URL)
+    qc = get_qdrant()
     embeddings = generate_movie_embeddings(MOVIES)
+    encoder = SparseEncoder()  # stable token ids from the persisted vocabulary
 
-    # Create a dedicated collection with BOTH dense and sparse vectors
-    qc.recreate_collection(
-        COLLECTION,
-        vectors_config={
-            "dense": models.VectorParams(
-                size=EMBEDDING_DIM, distance=models.Distance.COSINE
-            )
-        },
-        sparse_vectors_config={"sparse": models.SparseVectorParams()},
-    )
-
-    # Build simple sparse vectors from keywords (bag-of-words style)
-    def make_sparse(text: str) -> tuple[list[int], list[float]]:
-        words = set(text.lower().split())
-        indices = [hash(w) % 10000 for w in words]
-        values = [1.0] * len(indices)
-        return indices, values
-
-    # Insert with both vector types
-    points = []
-    for m in MOVIES:
-        text = f"{m['title']} {m['description']} {m['genre']}"
-        indices, values = make_sparse(text)
-        points.append(
-            models.PointStruct(
-                id=qdrant_id(m["id"]),
-                vector={
-                    "dense": embeddings[m["id"]],
-                    "sparse": models.SparseVector(indices=indices, values=values),
-                },
-                payload={"title": m["title"], "genre": m["genre"], "year": m["year"]},
-            )
-        )
-    qc.upsert(COLLECTION, points)
+    # Dedicated collection with BOTH dense and sparse (BM25-weighted) vectors
+    create_qdrant_hybrid_collection(qc, COLLECTION, MOVIES, embeddings, encoder)
 
     # Hybrid query: combine dense (semantic) + sparse (keyword)
     query_text = "space robots adventure"
     dense_vec = generate_query_embedding(query_text)
-    sparse_idx, sparse_val = make_sparse(query_text)
 
-    t0 = time.perf_counter()
-    results = qc.query_points(
-        COLLECTION,
-        prefetch=[
-            models.Prefetch(query=dense_vec, using="dense", limit=10),
-            models.Prefetch(
-                query=models.SparseVector(indices=sparse_idx, values=sparse_val),
-                using="sparse",
-                limit=10,
-            ),
-        ],
-        query=models.FusionQuery(fusion=models.Fusion.RRF),  # Reciprocal Rank Fusion
-        limit=5,
-        with_payload=True,
+    results = qdrant_hybrid_search(
+        qc, COLLECTION, encoder, query_text, dense_vec, LIMIT, PREFETCH_LIMIT
     )
-    ms = (time.perf_counter() - t0) * 1000
 
     print(f'\nQuery: "{query_text}"')
-    print(f"Qdrant Hybrid Search — RRF Fusion ({ms:.0f}ms):")
-    for i, p in enumerate(results.points):
+    print(f"Qdrant Hybrid Search — RRF Fusion ({results.ms:.0f}ms):")
+    for i, hit in enumerate(results.hits):
+        print(
+            f"  {i + 1}. {hit.payload['title']} (genre={hit.payload['genre']}, score={hit.score:.4f})"
+        )
+
+    # S3 Vectors: dense only — keyword side from a local BM25 index, same RRF
+    index = movie_index(MOVIES)
+    by_id = {m["id"]: m for m in MOVIES}
+    hits, stats = s3v_hybrid_search(
+        get_s3v(), index, query_text, dense_vec, LIMIT, PREFETCH_LIMIT
+    )
+    print(
+        f"\nS3 Vectors + local BM25 — RRF Fusion ({stats['ms']:.0f}ms: "
+        f"dense {stats['dense_ms']:.0f}ms, BM25 {stats['sparse_ms']:.2f}ms, "
+        f"fusion {stats['fusion_ms']:.2f}ms):"
+    )
+    for i, hit in enumerate(hits):
+        movie = by_id[hit.key]
         print(
-            f"  {i + 1}. {p.payload['title']} (genre={p.payload['genre']}, score={p.score:.4f})"
+            f"  {i + 1}. {movie['title']} (genre={movie['genre']}, score={hit.score:.4f})"
         )
 
-    print(f"\nS3 Vectors: ❌ Not supported")
-    print(f"  S3 Vectors only supports dense (float32) vectors.")
-    print(f"  No sparse vectors, no hybrid search, no fusion.")
+    print(f"\n→ Qdrant: dense + sparse vectors and RRF fusion server-side")
+    print(f"→ S3 Vectors: dense only; keyword index and fusion run client-side")
 
     # Cleanup dedicated collection
     qc.delete_collection(COLLECTION)
@@ -2,13 +2,13 @@
 
 import time
 
-from qdrant_client import models
-
 from core.clients import get_qdrant
 from core.config import QDRANT_COLLECTION, qdrant_id
 
 
 def run():
+    from qdrant_client import models
+
     qc = get_qdrant()
 
     print("=" * 60)
@@ -1,18 +1,20 @@
-"""Test 14: Scroll/Paginate with Filters — Qdrant only."""
+"""Test 14: Scroll/Paginate with Filters — Qdrant native, S3 via parallel list scan."""
 
 import time
 
-from qdrant_client import models
-
-from core.clients import get_qdrant
+from core.clients import get_qdrant, get_s3v
 from core.config import QDRANT_COLLECTION
+from core.dataset import FILTERS
+from core.filters import to_qdrant
+from core.s3v_scan import Cursor, scan_vectors
 
 
 def run():
     qc = get_qdrant()
+    flt = FILTERS["f1"]  # genre = Sci-Fi
 
     print("=" * 60)
-    print("TEST 14: Scroll/Paginate with Filter — Qdrant only")
+    print("TEST 14: Scroll/Paginate with Filter")
     print("=" * 60)
     print("  Browse all Sci-Fi movies WITHOUT a query vector")
     print("  (filter-only retrieval, paginated)")
@@ -21,13 +23,7 @@ def run():
     t0 = time.perf_counter()
     page1, next_offset = qc.scroll(
         QDRANT_COLLECTION,
-        scroll_filter=models.Filter(
-            must=[
-                models.FieldCondition(
-                    key="genre", match=models.MatchValue(value="Sci-Fi")
-                )
-            ]
-        ),
+        scroll_filter=to_qdrant(flt),
         limit=5,
         with_payload=True,
     )
@@ -42,13 +38,7 @@ def run():
         t0 = time.perf_counter()
         page2, _ = qc.scroll(
             QDRANT_COLLECTION,
-            scroll_filter=models.Filter(
-                must=[
-                    models.FieldCondition(
-                        key="genre", match=models.MatchValue(value="Sci-Fi")
-                    )
-                ]
-            ),
+            scroll_filter=to_qdrant(flt),
             limit=5,
             offset=next_offset,
             with_payload=True,
@@ -58,9 +48,30 @@ def run():
         for p in page2:
             print(f"  {p.payload['title']} ({p.payload['year']})")
 
-    print(f"\nS3 Vectors: ❌ Not supported")
-    print(f"  ListVectors exists but cannot apply filters.")
-    print(f"  QueryVectors requires a query vector — no browse/scroll.")
+    # S3 Vectors: no server-side filter on list_vectors — scan segments in
+    # parallel and filter each page locally; stop after one page, then resume.
+    sc = get_s3v()
+    t0 = time.perf_counter()
+    pages = scan_vectors(sc, flt)
+    first = next(pages)
+    pages.close()
+    saved = first.cursor.dumps()  # JSON — could be stored and resumed elsewhere
+    rest = list(scan_vectors(sc, flt, cursor=Cursor.loads(saved)))
+    ms = (time.perf_counter() - t0) * 1000
+    matches = [v for page in [first, *rest] for v in page.vectors]
+    scanned = sum(page.scanned for page in [first, *rest])
+
+    print(
+        f"\nS3 Vectors: {first.cursor.segments} parallel list_vectors segments, "
+        f"filtered locally ({ms:.0f}ms)"
+    )
+    print(f"  Scanned {scanned} vectors → {len(matches)} Sci-Fi, resumed after page 1:")
+    for v in matches[:5]:
+        print(f"  {v['metadata']['title']} ({v['metadata']['year']})")
+
+    print(f"\n→ Qdrant: server-side filtered scroll with an offset")
+    print(f"→ S3 Vectors: ListVectors has no filter — every vector is listed,")
+    print(f"  so cost grows with index size, not with the number of matches")
 
 
 if __name__ == "__main__":
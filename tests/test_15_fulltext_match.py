@@ -2,14 +2,14 @@
 
 import time
 
-from qdrant_client import models
-
 from core.clients import get_qdrant
 from core.config import QDRANT_COLLECTION
 from core.embeddings import generate_query_embedding
 
 
 def run():
+    from qdrant_client import models
+
     qc = get_qdrant()
 
     print("=" * 60)
@@ -2,10 +2,9 @@
 
 import time
 
-from qdrant_client import QdrantClient, models
-
-from core.config import EMBEDDING_DIM, QDRANT_URL, qdrant_id
-from core.embeddings import generate_query_embedding
+from core.clients import get_qdrant
+from core.config import EMBEDDING_DIM, qdrant_id
+from core.embeddings import generate_query_embedding, generate_query_embeddings
 
 COLLECTION = "movies_geo"  # Separate collection — don't touch shared 'movies'
 
@@ -37,11 +36,13 @@ MOVIES_WITH_LOCATION = [
 
 
 def run():
+    from qdrant_client import models
+
     print("=" * 60)
     print("TEST 16: Geo Filtering — Qdrant only")
     print("=" * 60)
 
-    qc = QdrantClient(url=QDRANT_URL)
+    qc = get_qdrant()
     qc.recreate_collection(
         COLLECTION,
         vectors_config=models.VectorParams(
@@ -50,14 +51,14 @@ def run():
     )
     qc.create_payload_index(COLLECTION, "location", models.PayloadSchemaType.GEO)
 
-    # Insert with geo locations
+    # Insert with geo locations (all titles embedded in one batch)
+    vectors = generate_query_embeddings([m["title"] for m in MOVIES_WITH_LOCATION])
     points = []
-    for m in MOVIES_WITH_LOCATION:
-        vec = generate_query_embedding(m["title"])
+    for m, vec in zip(MOVIES_WITH_LOCATION, vectors):
         points.append(
             models.PointStruct(
                 id=qdrant_id(m["id"]),
-                vector=vec,
+                vector=vec.tolist(),
                 payload={
                     "title": m["title"],
                     "location": {"lat": m["lat"], "lon": m["lon"]},
@@ -1,17 +1,24 @@
-"""Test 17: Group By — Qdrant only."""
+"""Test 17: Group By — Qdrant native vs S3 Vectors client-side."""
 
 import time
 
-from core.clients import get_qdrant
-from core.config import QDRANT_COLLECTION
+from core.clients import get_clients
+from core.config import QDRANT_COLLECTION, qdrant_id
+from core.dataset import MOVIES
 from core.embeddings import generate_query_embedding
+from core.metadata import MetadataTable
+from core.s3v_groups import s3v_query_groups
+
+GROUP_SIZE = 1
+LIMIT = 10
 
 
 def run():
-    qc = get_qdrant()
+    qc, sc = get_clients()
+    table = MetadataTable.from_records(MOVIES)
 
     print("=" * 60)
-    print("TEST 17: Grouping (group by genre, 1 best per genre) — Qdrant only")
+    print(f"TEST 17: Grouping (group by genre, {GROUP_SIZE} best per genre)")
     print("=" * 60)
 
     qvec = generate_query_embedding("great movies of all time")
@@ -21,21 +28,40 @@ def run():
         QDRANT_COLLECTION,
         query=qvec,
         group_by="genre",
-        group_size=1,
-        limit=10,
+        group_size=GROUP_SIZE,
+        limit=LIMIT,
         with_payload=True,
     )
     ms = (time.perf_counter() - t0) * 1000
 
-    print(f"\nTop movie per genre ({ms:.0f}ms):")
+    print(f"\nQdrant: top movie per genre ({ms:.0f}ms):")
     for group in results.groups:
         genre = group.id
         for hit in group.hits:
             print(f"  [{genre}] {hit.payload['title']} (score={hit.score:.4f})")
+    native = {g.id: [h.id for h in g.hits] for g in results.groups}
+
+    print(f"\nS3 Vectors: no group_by in QueryVectors API — grouped client-side")
+    print(
+        f"\n{'Strategy':<15} {'Calls':>5} {'Latency':>8} {'vs Qdrant':>9} {'Match':>7}"
+    )
+    print("-" * 48)
+    for strategy in ("auto", "per_group", "bucket"):
+        groups, stats = s3v_query_groups(
+            sc, qvec, "genre", table, LIMIT, GROUP_SIZE, strategy=strategy
+        )
+        same = sum(
+            native.get(g.id) == [qdrant_id(h.key) for h in g.hits] for g in groups
+        )
+        label = f"auto→{stats['strategy']}" if strategy == "auto" else strategy
+        print(
+            f"{label:<15} {stats['requests']:>5} {stats['ms']:>6.0f}ms "
+            f"{stats['ms'] / ms:>8.1f}x {same:>3}/{len(native)}"
+        )
 
-    print(f"\nS3 Vectors: ❌ Not supported")
-    print(f"  No group_by in QueryVectors API.")
-    print(f"  You'd have to fetch all results and group client-side.")
+    print(f"\n→ Qdrant: one query_points_groups call")
+    print(f"→ S3 Vectors: per_group = 1 call per genre (exact), bucket = 1 call")
+    print(f"  at topK=100 (may miss groups); auto picks from genre cardinality")
 
 
 if __name__ == "__main__":
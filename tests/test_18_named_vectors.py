@@ -2,22 +2,22 @@
 
 import time
 
-from qdrant_client import QdrantClient, models
-
-from core.config import EMBEDDING_DIM, QDRANT_URL, qdrant_id
+from core.clients import get_qdrant
+from core.config import EMBEDDING_DIM, qdrant_id
 from core.dataset import MOVIES
-from core.embeddings import generate_query_embedding, get_model
+from core.embeddings import generate_query_embedding, generate_query_embeddings
 
 COLLECTION = "movies_named"  # Separate collection — don't touch shared 'movies'
 
 
 def run():
+    from qdrant_client import models
+
     print("=" * 60)
     print("TEST 18: Named Vectors (title + description embeddings) — Qdrant only")
     print("=" * 60)
 
-    qc = QdrantClient(url=QDRANT_URL)
-    model = get_model()
+    qc = get_qdrant()
 
     # Collection with TWO named vectors per point
     qc.recreate_collection(
@@ -33,14 +33,16 @@ def run():
     )
 
     # Insert with separate embeddings for title and description
+    # (one batched encode per field)
+    movies = MOVIES[:20]  # use 20 for speed
+    title_vecs = generate_query_embeddings([m["title"] for m in movies])
+    desc_vecs = generate_query_embeddings([m["description"] for m in movies])
     points = []
-    for m in MOVIES[:20]:  # use 20 for speed
-        title_vec = model.encode(m["title"], normalize_embeddings=True).tolist()
-        desc_vec = model.encode(m["description"], normalize_embeddings=True).tolist()
+    for m, title_vec, desc_vec in zip(movies, title_vecs, desc_vecs):
         points.append(
             models.PointStruct(
                 id=qdrant_id(m["id"]),
-                vector={"title": title_vec, "description": desc_vec},
+                vector={"title": title_vec.tolist(), "description": desc_vec.tolist()},
                 payload={"title": m["title"], "genre": m["genre"]},
             )
         )
@@ -4,7 +4,10 @@ import time
 
 from core.clients import get_clients
 from core.config import QDRANT_COLLECTION, S3V_BUCKET_NAME, S3V_INDEX_NAME
+from core.dataset import MOVIES
 from core.embeddings import generate_query_embedding
+from core.metadata import MetadataTable
+from core.s3v_topk import categorical_partitions, s3v_query_top_k
 
 
 def run():
@@ -51,8 +54,20 @@ def run():
         print(f"REJECTED ✓")
         print(f"  Error: {str(e)[:100]}")
 
+    # S3 Vectors: topK=200 — one topK<=100 query per genre, heap-merged
+    partitions = categorical_partitions(MetadataTable.from_records(MOVIES), "genre")
+    hits, stats = s3v_query_top_k(sc, qvec, 200, partitions)
+    print(
+        f"\nS3 Vectors: topK=200 via {stats['requests']} genre partitions → "
+        f"returned {len(hits)} results ({stats['ms']:.0f}ms, "
+        f"{stats['saturated']} saturated) ✓"
+    )
+
     print(f"\n→ Qdrant: no hard topK limit (limited by data size)")
     print(f"→ S3 Vectors: hard max 100 per query")
+    print(
+        f"→ S3 Vectors: larger k = partitioned fan-out, one billed call per partition"
+    )
 
 
 if __name__ == "__main__":
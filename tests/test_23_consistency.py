@@ -2,13 +2,10 @@
 
 import time
 
-import boto3
-from qdrant_client import QdrantClient, models
-
+from core.clients import get_qdrant
 from core.config import (
     AWS_REGION,
     EMBEDDING_DIM,
-    QDRANT_URL,
     S3V_BUCKET_NAME,
     S3V_INDEX_NAME,
     qdrant_id,
@@ -19,6 +16,9 @@ COLLECTION = "movies_consistency"  # Separate collection — don't touch shared
 
 
 def run():
+    import boto3
+    from qdrant_client import models
+
     print("=" * 60)
     print("TEST 23: Consistency (query right after insert)")
     print("=" * 60)
@@ -27,7 +27,7 @@ def run():
     test_vec = generate_query_embedding(test_title)
 
     # ── Qdrant ─────────────────────────────────────────────────
-    qc = QdrantClient(url=QDRANT_URL)
+    qc = get_qdrant()
     qc.recreate_collection(
         COLLECTION,
         vectors_config=models.VectorParams(
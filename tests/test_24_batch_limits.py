@@ -28,6 +28,8 @@ Example: inserting 10,000 vectors
 
 For our 50-movie dataset: both handle it in a single call.
 At scale, S3 Vectors requires pagination and rate limiting.
+setup.py loads through core.s3v_loader.put_vectors_bulk: 500-vector /
+20 MiB chunks, concurrent calls behind RPS and vectors/sec token buckets.
 """)
 
 
@@ -0,0 +1,31 @@
+"""Unit tests for core.ground_truth.ExactIndex (python -m pytest tests/test_ground_truth.py)."""
+
+import numpy as np
+
+from core.ground_truth import ExactIndex
+
+
+def test_shared_rows_with_gap():
+    # Rows [0, 1, 1, 3] span 4 rows with 4 entries, which once passed the
+    # contiguous-slice check and scored matrix rows 0-3 instead.
+    matrix = np.eye(4, dtype=np.float32)
+    index = ExactIndex(matrix, ["a", "b", "c", "d"], np.array([0, 1, 1, 3]))
+
+    hits = index.search_ids(matrix[2], 4)[0]
+    assert all(score == 0.0 for _, score in hits)  # row 2 belongs to no id
+    top = index.search_ids(matrix[1], 2)[0]
+    assert sorted(i for i, _ in top) == ["b", "c"]
+
+
+def test_matches_brute_force():
+    rng = np.random.default_rng(0)
+    matrix = rng.standard_normal((200, 16)).astype(np.float32)
+    rows = np.sort(rng.choice(150, 120))  # duplicates and gaps
+    ids = [f"id{i}" for i in range(len(rows))]
+    queries = rng.standard_normal((8, 16)).astype(np.float32)
+
+    positions, scores = ExactIndex(matrix, ids, rows).search(queries, 10)
+    brute = queries @ matrix[rows].T
+    expected = np.sort(brute, axis=1)[:, ::-1][:, :10]
+    assert np.allclose(scores, expected, atol=1e-5)
+    assert np.allclose(np.take_along_axis(brute, positions, axis=1), scores)